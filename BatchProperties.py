@@ -0,0 +1,351 @@
+"""
+Batch (vectorized) calculation of the lipped C section properties.
+All functions accept scalars or equally shaped arrays of section dimensions and evaluate every section at once.
+"""
+import numpy as np
+
+# Nine 10° chords in each corner, node angles inside the corner (same discretization as SectionProp_C.lippedCSection)
+CHORDS = 9
+CORNER_STEPS = np.arange(1, CHORDS) * 10.0
+
+
+def lippedCDims(A, B, C, t, R):
+    """
+    Centreline dimensions of the lipped C sections.
+    :param A: Web height.
+    :param B: Flange width.
+    :param C: Lip length.
+    :param t: Nominal thickness.
+    :param R: Inner radius.
+    :return: dict of arrays, r, aa, bb, cc, tcore, a, b, c.
+    """
+    A, B, C, t, R = np.broadcast_arrays(*(np.asarray(i, dtype=float) for i in (A, B, C, t, R)))
+    r = R + t / 2.0
+    aa = A - t
+    bb = B - t
+    cc = C - t / 2.0
+    return {'r': r,
+            'aa': aa,
+            'bb': bb,
+            'cc': cc,
+            'tcore': t - 0.04,
+            'a': aa - 2 * r,
+            'b': bb - 2 * r,
+            'c': cc - r}
+
+
+def cornerChords(r, tol: float = None):
+    """
+    Number of chords in a corner, the distance between the arc and the chords is not more than tol.
+    :param r: Centreline radius, the largest value is used for arrays.
+    :param tol: Tolerance (mm). CHORDS if None.
+    """
+    if tol is None:
+        return CHORDS
+    if tol <= 0.0:
+        raise ValueError('Chord tolerance must be positive.')
+    # Half angle of the chord with the sagitta tol
+    half = np.arccos(max(1.0 - tol / float(np.max(r)), -1.0))
+    return max(int(np.ceil(np.pi / 4 / half)), 1)
+
+
+def cornerBasis(chords: int = CHORDS):
+    """
+    Unit radius vectors of the corner nodes, independent of the section dimensions.
+    :param chords: Number of chords in each corner.
+    :return: dict of the corner start angles (90, 180, 270, 0), each (sin, cos) arrays of the node angles.
+    """
+    steps = CORNER_STEPS if chords == CHORDS else np.arange(1, chords) * (90.0 / chords)
+    basis = {}
+    for start in (90, 180, 270, 0):
+        ang = np.radians(start + steps)
+        basis[start] = np.sin(ang), np.cos(ang)
+    return basis
+
+
+def lippedCNodes(A, B, C, t, R, chordTol: float = None):
+    """
+    Centreline node coordinates of the lipped C sections, from the bottom lip tip to the top lip tip.
+    Node numbering is the same as SectionProp_C.nodes.
+    :param chordTol: Largest distance between the corner arcs and the chords (mm), see cornerChords.
+    :return: x, y arrays with shape (N, 47) for the default chords.
+    """
+    dims = lippedCDims(A, B, C, t, R)
+    return nodesFromDims(dims, cornerBasis(cornerChords(dims['r'], chordTol)))
+
+
+def nodesFromDims(dims, basis=None):
+    """
+    Node coordinates of the centreline dimensions returned by lippedCDims.
+    :param basis: Corner radius vectors, see cornerBasis. Calculated if None.
+    :return: x, y arrays with shape (N, 47).
+    """
+    basis = cornerBasis() if basis is None else basis
+    r = dims['r'].reshape(-1, 1)
+    aa = dims['aa'].reshape(-1, 1)
+    bb = dims['bb'].reshape(-1, 1)
+    cc = dims['cc'].reshape(-1, 1)
+    a = dims['a'].reshape(-1, 1)
+    b = dims['b'].reshape(-1, 1)
+
+    def corner(cx, cy, start_ang):
+        # Rotating the radius vector (0, r) gives (r.sin, r.cos)
+        sin, cos = basis[start_ang]
+        return cx + r * sin, cy + r * cos
+
+    def point(px, py):
+        return np.broadcast_to(px, r.shape), np.broadcast_to(py, r.shape)
+
+    parts = [point(bb, cc),
+             point(bb, r),
+             corner(bb - r, r, 90),
+             point(bb - r, 0.0),
+             point(r + b / 2.0, 0.0),
+             point(r, 0.0),
+             corner(r, r, 180),
+             point(0.0, r),
+             point(0.0, r + a * (1.0 / 4.0)),
+             point(0.0, r + a * (2.0 / 4.0)),
+             point(0.0, r + a * (3.0 / 4.0)),
+             point(0.0, r + a),
+             corner(r, aa - r, 270),
+             point(r, aa),
+             point(r + b / 2.0, aa),
+             point(bb - r, aa),
+             corner(bb - r, aa - r, 0),
+             point(bb, aa - r),
+             point(bb, aa - cc)]
+    x = np.concatenate([i[0] for i in parts], axis=1)
+    y = np.concatenate([i[1] for i in parts], axis=1)
+    return x, y
+
+
+def grossProps(A, B, C, t, R, chordTol: float = None):
+    """
+    Gross section properties of the lipped C sections. Same calculation as SectionProp_C.grossProp,
+    evaluated with whole-array operations over all sections.
+    :param A: Web height.
+    :param B: Flange width.
+    :param C: Lip length.
+    :param t: Nominal thickness.
+    :param R: Inner radius.
+    :param chordTol: Largest distance between the corner arcs and the chords (mm), see cornerChords.
+    :return: dict of arrays, Ag, zgx, zgy, Ix, Wx, Iy, Wy, Ixy, Iw, xsc, ysc, Cw, It, xo.
+    """
+    dims = lippedCDims(A, B, C, t, R)
+    x, y = nodesFromDims(dims, cornerBasis(cornerChords(dims['r'], chordTol)))
+    return grossFromNodes(x, y, t, dims['r'])
+
+
+def grossFromNodes(x, y, t, r):
+    """
+    Gross section properties of the node coordinates returned by nodesFromDims.
+    :param t: Nominal thickness.
+    :param r: Centreline corner radius.
+    :return: dict of arrays, see grossProps.
+    """
+    shape = np.shape(r)
+    r = np.reshape(r, (-1, 1))
+    t = np.broadcast_to(np.asarray(t, dtype=float), shape).reshape(-1, 1)
+    # Segment end points
+    xi, xj = x[:, :-1], x[:, 1:]
+    yi, yj = y[:, :-1], y[:, 1:]
+    # Area of cross-section
+    ba = np.sqrt((xi - xj) ** 2 + (yi - yj) ** 2)
+    da = ba * t
+    Ar = np.sum(da, axis=1)
+    Lt = np.sum(ba, axis=1)
+    # Total rj.tetaj/90
+    Trj = 4 * 4 * r[:, 0] * (1.0 / 4.0)
+    delta = 0.43 * Trj / Lt
+    # First moment of area and coordinate for gravity centre
+    Sx0 = np.sum((yj + yi) * da / 2, axis=1)
+    Sy0 = np.sum((xj + xi) * da / 2, axis=1)
+    zgy = Sx0 / Ar
+    zgx = Sy0 / Ar
+    # Second moment of area
+    Ix = np.sum((yj ** 2 + yi ** 2 + yj * yi) * da / 3, axis=1) - Ar * zgy ** 2
+    Iy = np.sum((xj ** 2 + xi ** 2 + xj * xi) * da / 3, axis=1) - Ar * zgx ** 2
+    # Product moment of area
+    Ixy = np.sum((2 * xi * yi + 2 * xj * yj + xi * yj + xj * yi) * da / 6, axis=1) - Sx0 * Sy0 / Ar
+    # Sectoral coordinates
+    w0 = xi * yj - xj * yi
+    w = np.concatenate([np.zeros([len(x), 1]), np.cumsum(w0, axis=1)], axis=1)
+    wi, wj = w[:, :-1], w[:, 1:]
+    Iw = np.sum((wi + wj) * da / 2, axis=1)
+    # Sectorial constants
+    Ixw = np.sum((2 * xi * wi + 2 * xj * wj + xi * wj + xj * wi) * da / 6, axis=1) - Sy0 * Iw / Ar
+    Iyw = np.sum((2 * yi * wi + 2 * yj * wj + yi * wj + yj * wi) * da / 6, axis=1) - Sx0 * Iw / Ar
+    Iww = np.sum((wj ** 2 + wi ** 2 + wj * wi) * da / 3, axis=1) - Iw ** 2 / Ar
+    # Shear centre
+    xsc = (Iyw * Iy - Ixw * Ixy) / (Ix * Iy - Ixy ** 2)
+    ysc = (-Ixw * Ix + Iyw * Ixy) / (Ix * Iy - Ixy ** 2)
+    # Warping constant
+    Cw = Iww + ysc * Ixw - xsc * Iyw
+    # Torsion constant
+    It = np.sum(da, axis=1) * t[:, 0] ** 2 / 3
+    # Distance between centroid and shear centre
+    xo = np.abs(xsc) + zgx
+    # Distances from the boundaries
+    zy = np.maximum(zgy, np.max(y, axis=1) - zgy)
+    zx = np.maximum(zgx, np.max(x, axis=1) - zgx)
+    prop = {'Ag': Ar,
+            'zgx': zgx,
+            'zgy': zgy,
+            'Ix': Ix,
+            'Wx': Ix * (1 - 2 * delta) / zy,
+            'Iy': Iy,
+            'Wy': Iy * (1 - 2 * delta) / zx,
+            'Ixy': Ixy,
+            'Iw': Iw,
+            'xsc': xsc,
+            'ysc': ysc,
+            'Cw': Cw,
+            'It': It,
+            'xo': xo}
+    return {key: value.reshape(shape) for key, value in prop.items()}
+
+
+# ======================================================================================================================
+# CLOSED-FORM GROSS PROPERTIES
+# ======================================================================================================================
+def _arcGram(start: float):
+    """
+    Integrals of the products of the functions 1, (u - start), cos(u), sin(u) over a quarter arc from the angle
+    start (degrees), in the order of the functions.
+    """
+    p0 = np.radians(start)
+    p1 = p0 + np.pi / 2
+    th = np.pi / 2
+    c1 = np.sin(p1) - np.sin(p0)
+    s1 = np.cos(p0) - np.cos(p1)
+    uc = th * np.sin(p1) + np.cos(p1) - np.cos(p0)
+    us = -th * np.cos(p1) + np.sin(p1) - np.sin(p0)
+    cc = th / 2 + (np.sin(2 * p1) - np.sin(2 * p0)) / 4
+    ss = th / 2 - (np.sin(2 * p1) - np.sin(2 * p0)) / 4
+    cs = (np.sin(p1) ** 2 - np.sin(p0) ** 2) / 2
+    return np.array([[th, th ** 2 / 2, c1, s1],
+                     [th ** 2 / 2, th ** 3 / 3, uc, us],
+                     [c1, uc, cc, cs],
+                     [s1, us, cs, ss]])
+
+
+# Constants of the four corners: rows of the Gram matrix and cos, sin at the start and end angles
+ARC_GRAM = {start: tuple(tuple(row) for row in _arcGram(start).tolist()) for start in (90, 180, 270, 0)}
+ARC_ENDS = {start: tuple(float(f(np.radians(start + i))) for i in (0, 90) for f in (np.cos, np.sin))
+            for start in (90, 180, 270, 0)}
+
+
+def _lineIntegrals(xi, yi, xj, yj, wi):
+    # Integrals L, x, y, w, xx, yy, ww, xy, xw, yw of the straight segment and the sectorial coordinate at the end,
+    # exact for the linear x, y and w. The segments are parallel to the axes.
+    ba = abs(xj - xi) + abs(yj - yi)
+    wj = wi + xi * yj - xj * yi
+    b3, b6 = ba / 3, ba / 6
+    return (ba, (xi + xj) * ba / 2, (yi + yj) * ba / 2, (wi + wj) * ba / 2,
+            (xi * xi + xj * xj + xi * xj) * b3,
+            (yi * yi + yj * yj + yi * yj) * b3,
+            (wi * wi + wj * wj + wi * wj) * b3,
+            ((xi + xi + xj) * yi + (xi + xj + xj) * yj) * b6,
+            ((xi + xi + xj) * wi + (xi + xj + xj) * wj) * b6,
+            ((yi + yi + yj) * wi + (yi + yj + yj) * wj) * b6), wj
+
+
+def _arcIntegrals(cx, cy, r, start: float, wi):
+    """
+    Integrals of the quarter arc with the centre (cx, cy), points (cx + r.sin(u), cy + r.cos(u)).
+    The sectorial coordinate is w(u) = w0 + w1.(u - start) + w2.cos(u) + w3.sin(u). With the Gram matrix G of
+    1, (u - start), cos(u), sin(u) the integral of f.g is r.(f . G.g), only the used rows of G.g are formed.
+    :return: Integrals in the order of _lineIntegrals and the sectorial coordinate at the end.
+    """
+    (g00, g01, g02, g03), (g10, g11, g12, g13), (g20, g21, g22, g23), (g30, g31, g32, g33) = ARC_GRAM[start]
+    cos0, sin0, cos1, sin1 = ARC_ENDS[start]
+    w0 = wi - r * cx * cos0 + r * cy * sin0
+    w1 = -r * r
+    w2 = r * cx
+    w3 = -r * cy
+    x0 = g00 * cx + g03 * r
+    x3 = g30 * cx + g33 * r
+    y0 = g00 * cy + g02 * r
+    y2 = g20 * cy + g22 * r
+    y3 = g30 * cy + g32 * r
+    v0 = g00 * w0 + g01 * w1 + g02 * w2 + g03 * w3
+    v1 = g10 * w0 + g11 * w1 + g12 * w2 + g13 * w3
+    v2 = g20 * w0 + g21 * w1 + g22 * w2 + g23 * w3
+    v3 = g30 * w0 + g31 * w1 + g32 * w2 + g33 * w3
+    return (r * g00, r * x0, r * y0, r * v0,
+            r * (cx * x0 + r * x3),
+            r * (cy * y0 + r * y2),
+            r * (w0 * v0 + w1 * v1 + w2 * v2 + w3 * v3),
+            r * (cx * y0 + r * y3),
+            r * (cx * v0 + r * v3),
+            r * (cy * v0 + r * v2)), w0 + w1 * g00 + w2 * cos1 + w3 * sin1
+
+
+def grossPropsClosed(A, B, C, t, R):
+    """
+    Closed-form gross section properties of the lipped C sections. Straight parts and the circular corners
+    are integrated exactly, the other calculations are the same as in grossProps. Scalar inputs are evaluated
+    with float arithmetic.
+    :return: dict of floats or arrays, see grossProps.
+    """
+    values = (A, B, C, t, R)
+    if not all(np.isscalar(i) for i in values):
+        values = np.broadcast_arrays(*(np.asarray(i, dtype=float) for i in values))
+    A, B, C, t, R = values
+    # Centreline dimensions, see lippedCDims
+    r = R + t / 2.0
+    aa = A - t
+    bb = B - t
+    cc = C - t / 2.0
+    zero = 0.0 * r
+    # Straight segments (xi, yi, xj, yj) and arcs (cx, cy, start angle) from the bottom lip tip to the top lip tip
+    parts = [('line', (bb, cc, bb, r)),
+             ('arc', (bb - r, r, 90)),
+             ('line', (bb - r, zero, r, zero)),
+             ('arc', (r, r, 180)),
+             ('line', (zero, r, zero, aa - r)),
+             ('arc', (r, aa - r, 270)),
+             ('line', (r, aa, bb - r, aa)),
+             ('arc', (bb - r, aa - r, 0)),
+             ('line', (bb, aa - r, bb, aa - cc))]
+    ints = []
+    w = zero
+    for kind, segment in parts:
+        if kind == 'line':
+            values, w = _lineIntegrals(*segment, w)
+        else:
+            values, w = _arcIntegrals(segment[0], segment[1], r, segment[2], w)
+        ints.append(values)
+    Lt, X, Y, W, XX, YY, WW, XY, XW, YW = map(sum, zip(*ints))
+    Ar = Lt * t
+    Sx0, Sy0, Iw = Y * t, X * t, W * t
+    zgy = Sx0 / Ar
+    zgx = Sy0 / Ar
+    Ix = YY * t - Ar * zgy ** 2
+    Iy = XX * t - Ar * zgx ** 2
+    Ixy = XY * t - Sx0 * Sy0 / Ar
+    Ixw = XW * t - Sy0 * Iw / Ar
+    Iyw = YW * t - Sx0 * Iw / Ar
+    Iww = WW * t - Iw ** 2 / Ar
+    xsc = (Iyw * Iy - Ixw * Ixy) / (Ix * Iy - Ixy ** 2)
+    ysc = (-Ixw * Ix + Iyw * Ixy) / (Ix * Iy - Ixy ** 2)
+    # Total rj.tetaj/90
+    delta = 0.43 * 4 * r / Lt
+    # Larger distance to the outer lines, max(zgy, aa - zgy) without numpy for the scalars
+    zy = aa / 2 + abs(zgy - aa / 2)
+    zx = bb / 2 + abs(zgx - bb / 2)
+    return {'Ag': Ar,
+            'zgx': zgx,
+            'zgy': zgy,
+            'Ix': Ix,
+            'Wx': Ix * (1 - 2 * delta) / zy,
+            'Iy': Iy,
+            'Wy': Iy * (1 - 2 * delta) / zx,
+            'Ixy': Ixy,
+            'Iw': Iw,
+            'xsc': xsc,
+            'ysc': ysc,
+            'Cw': Iww + ysc * Ixw - xsc * Iyw,
+            'It': Ar * t ** 2 / 3,
+            'xo': abs(xsc) + zgx}
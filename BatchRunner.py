@@ -0,0 +1,292 @@
+"""
+Command line batch calculation of lipped C sections. Reads rows of (A, B, C, t, R, fy) from a CSV, JSONL or JSON
+file, calculates the gross and the effective section properties of every load mode in chunks on a process pool and
+writes one output row per input row. No plots are created.
+The files are streamed: rows are read lazily, calculated in fixed-size chunks and the results are written chunk by
+chunk, so the memory does not depend on the number of rows. Files ending with .gz, .bz2 or .xz are compressed.
+
+Usage: python BatchRunner.py sections.csv.gz -o results.jsonl.gz [--jobs n] [--chunk-size n] [--quiet]
+"""
+import argparse
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+import BatchProperties as bprop
+from SectionCatalog import INPUTS, GROSS, EFFECTIVE, effectiveProps
+
+COLUMNS = INPUTS + GROSS + EFFECTIVE
+FORMATS = ('.csv', '.jsonl', '.json')
+COMPRESSION = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def calculate(rows, columns=None):
+    """
+    Gross and effective section properties of the rows, all rows at once.
+    :param rows: Array with shape (n, 6), columns INPUTS.
+    :param columns: Result columns, COLUMNS if None. Only the load modes of the given columns are calculated.
+    :return: dict of arrays with shape (n,). Sections the calculation fails for are NaN.
+    """
+    columns = COLUMNS if columns is None else columns
+    rows = np.asarray(rows, dtype=float).reshape(-1, len(INPUTS))
+    A, B, C, t, R = rows[:, :5].T
+    res = {name: rows[:, i] for i, name in enumerate(INPUTS)}
+    with np.errstate(all='ignore'):
+        gross = bprop.grossProps(A, B, C, t, R)
+    res.update({name: np.reshape(gross[name], -1) for name in GROSS})
+    res.update(effectiveProps(rows, res['zgx'], [name for name in EFFECTIVE if name in columns]))
+    return {name: res[name] for name in columns}
+
+
+def _split(path: str):
+    # File format and compression of the path, e.g. ('.csv', '.gz') for rows.csv.gz
+    root, ext = os.path.splitext(path.lower())
+    compression = ext if ext in COMPRESSION else ''
+    if compression:
+        ext = os.path.splitext(root)[1]
+    if ext not in FORMATS:
+        raise ValueError(f'Unknown file format {ext}, use one of {FORMATS} (optionally {tuple(COMPRESSION)}).')
+    return ext, compression
+
+
+def _format(path: str):
+    return _split(path)[0]
+
+
+def _open(path: str, mode: str):
+    # Text file, compressed by the extension
+    compression = _split(path)[1]
+    if compression:
+        return COMPRESSION[compression](path, mode + 't', newline='')
+    return open(path, mode, newline='')
+
+
+def _row(values):
+    # Input row from a list or a dict with the INPUTS names
+    if isinstance(values, dict):
+        return [float(values[name]) for name in INPUTS]
+    if len(values) != len(INPUTS):
+        raise ValueError(f'Input rows need {len(INPUTS)} values {INPUTS}, got {len(values)}.')
+    return [float(i) for i in values]
+
+
+def iterRows(path: str):
+    """
+    Input rows read lazily, one at a time. CSV files (optional header with the INPUTS names) and JSONL files
+    (one list or dict per line) are streamed, JSON files (list of lists or dicts) are loaded at once.
+    Files ending with .gz, .bz2 or .xz are decompressed.
+    :return: Generator of lists with 6 values.
+    """
+    ext = _format(path)
+    with _open(path, 'r') as file:
+        if ext == '.json':
+            yield from (_row(i) for i in json.load(file))
+        elif ext == '.jsonl':
+            yield from (_row(json.loads(line)) for line in file if line.strip())
+        else:
+            lines = (line for line in csv.reader(file) if line)
+            first = next(lines, None)
+            if first is None:
+                return
+            if set(first) == set(INPUTS):
+                yield from (_row(dict(zip(first, line))) for line in lines)
+            else:
+                yield _row(first)
+                yield from (_row(line) for line in lines)
+
+
+def iterChunks(rows, chunkSize: int):
+    """Arrays with shape (chunkSize, 6) of the rows, the last one may be shorter."""
+    if chunkSize < 1:
+        raise ValueError('Chunk size must be positive.')
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunkSize:
+            yield np.array(chunk, dtype=float)
+            chunk = []
+    if chunk:
+        yield np.array(chunk, dtype=float)
+
+
+def readRows(path: str):
+    """
+    Input rows of a file, see iterRows.
+    :return: Array with shape (n, 6).
+    """
+    return np.array(list(iterRows(path)), dtype=float).reshape(-1, len(INPUTS))
+
+
+class ResultWriter:
+    """
+    Writes result chunks incrementally to a CSV (with a header), JSONL or JSON (list of dicts) file,
+    compressed if the name ends with .gz, .bz2 or .xz. Failed results are nan in CSV and null in JSON.
+    """
+
+    def __init__(self, path: str):
+        self.format = _format(path)
+        self.rows = 0
+        self._file = _open(path, 'w')
+        self._names = None
+        self._csv = csv.writer(self._file) if self.format == '.csv' else None
+        if self.format == '.json':
+            self._file.write('[')
+
+    def write(self, res):
+        """Writes the rows of the result columns, see calculate."""
+        if self._names is None:
+            self._names = [i for i in COLUMNS if i in res]
+            if self._csv is not None:
+                self._csv.writerow(self._names)
+        values = np.column_stack([res[i] for i in self._names]).tolist()
+        if self._csv is not None:
+            self._csv.writerows([repr(i) for i in row] for row in values)
+        elif self.format == '.jsonl':
+            self._file.writelines(self._json(row) + '\n' for row in values)
+        else:
+            self._file.write((', ' if self.rows else '') + ', '.join(self._json(row) for row in values))
+        self.rows += len(values)
+
+    def _json(self, row):
+        # Failed results (NaN) are written as null, NaN is not valid JSON
+        return json.dumps({name: None if np.isnan(value) else value for name, value in zip(self._names, row)},
+                          allow_nan=False)
+
+    def close(self):
+        if self._csv is not None and self._names is None:
+            self._csv.writerow(COLUMNS)
+        if self.format == '.json':
+            self._file.write(']')
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def writeResults(path: str, res):
+    """Writes the result columns, CSV with a header, JSONL or JSON list of dicts."""
+    with ResultWriter(path) as writer:
+        if len(res.get('A', ())):
+            writer.write(res)
+
+
+def calculateChunks(chunks, jobs: int, columns=None):
+    """
+    Results of the chunks in input order, on a process pool if jobs > 1. At most 2 jobs chunks are in flight on
+    the pool, so the memory does not grow with the number of chunks.
+    :param chunks: Iterable of arrays with shape (n, 6), consumed lazily.
+    :param jobs: Number of processes.
+    :param columns: Result columns, see calculate.
+    :return: Generator of dicts of arrays, see calculate.
+    """
+    func = partial(calculate, columns=columns)
+    if jobs == 1:
+        yield from map(func, chunks)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(func, chunk))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def runStats(rows: int, chunks: int, jobs: int, elapsed: float, failed: int):
+    """
+    Statistics of a run.
+    :param elapsed: Wall time (s).
+    :param failed: Rows with a NaN result, see failedRows.
+    :return: dict, rows, chunks, jobs, seconds, rowsPerSecond, failed.
+    """
+    return {'rows': rows, 'chunks': chunks, 'jobs': jobs, 'seconds': elapsed,
+            'rowsPerSecond': rows / elapsed if elapsed > 0 else float('inf'), 'failed': failed}
+
+
+def failedRows(res):
+    """Number of rows with a NaN result column of the results, see calculate."""
+    values = [res[i] for i in res if i not in INPUTS]
+    return int(np.sum(np.isnan(np.column_stack(values)).any(axis=1))) if values else 0
+
+
+def run(rows, jobs: int = None, chunkSize: int = 256, progress=None):
+    """
+    Calculates the rows in chunks, on a process pool if jobs > 1.
+    :param jobs: Number of processes, os.cpu_count() if None.
+    :param chunkSize: Rows of a chunk, calculated vectorized in one task.
+    :param progress: Called with (finished rows, all rows) after every chunk.
+    :return: dict of arrays, see calculate, and dict of the run statistics.
+    """
+    rows = np.asarray(rows, dtype=float).reshape(-1, len(INPUTS))
+    jobs = (os.cpu_count() or 1) if jobs is None else jobs
+    chunks = list(iterChunks(rows, chunkSize))
+    start = time.perf_counter()
+    parts, done = [], 0
+    for part in calculateChunks(chunks, min(jobs, max(len(chunks), 1))):
+        parts.append(part)
+        done += len(part['A'])
+        if progress is not None:
+            progress(done, len(rows))
+    elapsed = time.perf_counter() - start
+    res = {name: np.concatenate([i[name] for i in parts]) if parts else np.zeros(0) for name in COLUMNS}
+    return res, runStats(len(rows), len(chunks), jobs, elapsed, failedRows(res))
+
+
+def stream(inputPath: str, outputPath: str, jobs: int = None, chunkSize: int = 256, progress=None):
+    """
+    Calculates an input file of any size and writes the results chunk by chunk. Memory is bounded by the chunk
+    size and the number of jobs, not by the number of rows.
+    :param progress: Called with (finished rows, None) after every chunk.
+    :return: dict of the run statistics, see runStats.
+    """
+    _format(outputPath)
+    jobs = (os.cpu_count() or 1) if jobs is None else jobs
+    start = time.perf_counter()
+    chunks = failed = 0
+    with ResultWriter(outputPath) as writer:
+        for part in calculateChunks(iterChunks(iterRows(inputPath), chunkSize), jobs):
+            writer.write(part)
+            chunks += 1
+            failed += failedRows(part)
+            if progress is not None:
+                progress(writer.rows, None)
+    return runStats(writer.rows, chunks, jobs, time.perf_counter() - start, failed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gross and effective properties of lipped C sections.')
+    parser.add_argument('input', help='CSV, JSONL or JSON file of (A, B, C, t, R, fy) rows.')
+    parser.add_argument('-o', '--output', required=True, help='Result file, .csv, .jsonl or .json.')
+    parser.add_argument('--jobs', type=int, default=None, help='Processes (default: number of CPUs).')
+    parser.add_argument('--chunk-size', type=int, default=256, help='Rows calculated together in one task.')
+    parser.add_argument('--quiet', action='store_true', help='No progress output.')
+    args = parser.parse_args(argv)
+
+    def progress(done, total):
+        print(f'\r{done} rows', end='', file=sys.stderr, flush=True)
+
+    stats = stream(args.input, args.output, args.jobs, args.chunk_size, None if args.quiet else progress)
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(f'{stats["rows"]} rows in {stats["chunks"]} chunks on {stats["jobs"]} processes: '
+          f'{stats["seconds"]:.2f} s, {stats["rowsPerSecond"]:.0f} rows/s, {stats["failed"]} failed',
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
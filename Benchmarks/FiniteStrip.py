@@ -0,0 +1,72 @@
+"""
+Validation of the finite strip solver against closed-form elastic buckling stresses:
+a simply supported plate under compression with one half-wave, k = (b / a + a / b)², and the flexural
+buckling of a long lipped C column about the weak axis, π² E Iy / L².
+
+Usage: python Benchmarks/FiniteStrip.py [--strips n] [--rtol r]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import FiniteStrip as fsm  # noqa: E402
+from PropertiesCalculator import SectionProp_C  # noqa: E402
+
+
+def plate(b: float, t: float, strips: int):
+    """Nodes and elements of a plate with simply supported long edges, unit compression."""
+    count = strips + 1
+    nodes = np.zeros([count, 8])
+    nodes[:, 0] = np.arange(count)
+    nodes[:, 1] = np.linspace(0.0, b, count)
+    nodes[:, 3:7] = 1
+    nodes[[0, -1], 4] = 0
+    nodes[:, 7] = 1.0
+    ids = np.arange(strips)
+    elements = np.column_stack([ids, ids, ids + 1, np.full(strips, t), np.zeros(strips)])
+    return nodes, elements
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Finite strip solver against closed-form buckling stresses.')
+    parser.add_argument('--strips', type=int, default=10, help='Strips of the plate.')
+    parser.add_argument('--rtol', type=float, default=1e-2)
+    args = parser.parse_args(argv)
+    failed = []
+
+    b, t = 100.0, 1.0
+    nodes, elements = plate(b, t, args.strips)
+    ratios = np.array([0.5, 1.0, 1.5, 2.0])
+    start = time.perf_counter()
+    lf, _, _ = fsm.buckling(nodes, elements, ratios * b)
+    sigmaE = np.pi ** 2 * fsm.E / (12 * (1 - fsm.v ** 2)) * (t / b) ** 2
+    k = (1 / ratios + ratios) ** 2
+    diff = np.abs(lf[:, 0] / (k * sigmaE) - 1)
+    print(f'Plate a/b {ratios}: k = {np.round(lf[:, 0] / sigmaE, 3)}, largest difference {diff.max():.2e}, '
+          f'{(time.perf_counter() - start) * 1000:.1f} ms')
+    if not diff.max() <= args.rtol:
+        failed.append('plate')
+
+    sec = SectionProp_C(150.0, 60.0, 20.0, 1.5, 2.0, 350.0)
+    stress = fsm.stresses(sec.nodes, sec.elements, N=sec.Ar)
+    L = 20000.0
+    lf, _, _ = fsm.buckling(sec.nodes, sec.elements, L, stress)
+    euler = np.pi ** 2 * fsm.E * sec.Iy / L ** 2 / sec.Ar
+    diff = abs(lf[0, 0] / euler - 1)
+    print(f'Column L = {L:g}: {lf[0, 0]:.3f} MPa, Euler {euler:.3f} MPa, difference {diff:.2e}')
+    if not diff <= args.rtol:
+        failed.append('column')
+
+    if failed:
+        print(f'FAIL: difference over {args.rtol:g} for {", ".join(failed)}')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Validation and timing of the closed-form gross section properties against the discretized reference.
+The discretized polyline replaces every corner with 10° chords, so the two differ by the chord error only.
+With a chord tolerance the corners get as many chords as needed and the difference has to shrink.
+The closed form has to be faster than the discretized calculation by the given factors, for one section (float
+arithmetic) and for a batch (numpy arrays, both calculations are vectorized and bound by the array operations).
+
+Usage: python Benchmarks/GrossProps.py [--sections n] [--rtol r] [--seed s] [--chord-tol mm] [--min-speedup f]
+       [--min-batch-speedup f]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BatchProperties as bprop  # noqa: E402
+from PropertiesCalculator import SectionProp_C  # noqa: E402
+
+# Properties which are zero for the symmetric section are compared relative to another property
+SCALE = {'Ixy': 'Ix'}
+
+
+def randomSections(n: int, seed: int = 0):
+    """A, B, C, t, R arrays of n sections in the usual range of lipped C sections."""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(80.0, 300.0, n), rng.uniform(40.0, 100.0, n), rng.uniform(8.0, 30.0, n),
+            rng.uniform(0.8, 3.0, n), rng.uniform(1.0, 4.0, n))
+
+
+def compareGross(A, B, C, t, R, chordTol: float = None):
+    """
+    Largest relative difference of every property between the closed-form and the discretized calculation.
+    :param chordTol: Chord tolerance of the discretized calculation, see BatchProperties.cornerChords.
+    :return: dict of the property names.
+    """
+    ref = bprop.grossProps(A, B, C, t, R, chordTol)
+    new = bprop.grossPropsClosed(A, B, C, t, R)
+    return {key: float(np.max(np.abs(new[key] - ref[key]) / np.abs(ref[SCALE.get(key, key)]))) for key in ref}
+
+
+def timeit(func, repeat: int = 5, number: int = 1):
+    """Best time of a call in ms, every repeat times number calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1000.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Closed-form gross properties against the discretized reference.')
+    parser.add_argument('--sections', type=int, default=1000)
+    parser.add_argument('--rtol', type=float, default=2e-3, help='Allowed relative difference (chord error).')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chord-tol', type=float, default=1e-3, help='Chord tolerance of the refined check (mm).')
+    parser.add_argument('--min-speedup', type=float, default=10.0, help='Required speedup for one section.')
+    parser.add_argument('--min-batch-speedup', type=float, default=2.5, help='Required speedup for the batch.')
+    args = parser.parse_args(argv)
+
+    dims = randomSections(args.sections, args.seed)
+    diff = compareGross(*dims)
+    for key, value in diff.items():
+        print(f'{key:>4}: {value:.2e}')
+
+    fine = compareGross(*dims, chordTol=args.chord_tol)
+    chords = bprop.cornerChords(dims[4] + dims[3] / 2.0, args.chord_tol)
+    print(f'{chords} chords per corner (tolerance {args.chord_tol:g} mm): '
+          f'largest difference {max(fine.values()):.2e}, 10° chords {max(diff.values()):.2e}')
+
+    # Single section, the functions and SectionProp_C (with the report) with both methods
+    one = [float(i[0]) for i in dims]
+    single = {'discretized': timeit(lambda: bprop.grossProps(*one), number=100),
+              'closedForm': timeit(lambda: bprop.grossPropsClosed(*one), number=1000)}
+    section = {method: timeit(lambda: SectionProp_C(*one, 350.0, grossMethod=method).prop, number=100)
+               for method in ('discretized', 'closedForm')}
+    batch = {'discretized': timeit(lambda: bprop.grossProps(*dims), number=10),
+             'closedForm': timeit(lambda: bprop.grossPropsClosed(*dims), number=10)}
+    speedup = {}
+    for name, times in (('1 section', single), ('SectionProp_C', section), (f'{args.sections} sections', batch)):
+        speedup[name] = times['discretized'] / times['closedForm']
+        print(f'{name}: discretized {times["discretized"]:.4f} ms, closedForm {times["closedForm"]:.4f} ms, '
+              f'{speedup[name]:.1f}x')
+
+    failed = [key for key, value in diff.items() if not value <= args.rtol]
+    if failed:
+        print(f'FAIL: difference over {args.rtol:g} for {", ".join(failed)}')
+        return 1
+    if not max(fine.values()) < max(diff.values()):
+        print('FAIL: finer chords do not approach the closed form')
+        return 1
+    for name, target in (('1 section', args.min_speedup), (f'{args.sections} sections', args.min_batch_speedup)):
+        if not speedup[name] >= target:
+            print(f'FAIL: closed form {speedup[name]:.1f}x faster for {name}, required {target:g}x')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
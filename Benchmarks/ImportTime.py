@@ -0,0 +1,67 @@
+"""
+Cold-start import benchmark. Runs `python -X importtime` in a fresh interpreter and checks that importing the
+library stays within the time budget and does not load matplotlib.
+
+Usage: python Benchmarks/ImportTime.py [module] [--budget ms] [--repeat n]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modules which must not be loaded by a library import
+FORBIDDEN = ('matplotlib',)
+
+
+def importTime(module: str):
+    """
+    Imports the module in a new interpreter.
+    :param module: Module name.
+    :return: Cumulative import time of the module in ms, names of all imported modules.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    total = None
+    loaded = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        fields = line[len('import time:'):].split('|')
+        if not fields[0].strip().isdigit():
+            continue  # Header line
+        name = fields[2].strip()
+        loaded.append(name)
+        if name == module:
+            total = int(fields[1]) / 1000.0
+    return total, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Import-time guard for the cold-start budget.')
+    parser.add_argument('module', nargs='?', default='PropertiesCalculator')
+    parser.add_argument('--budget', type=float, default=250.0, help='Budget in ms (best of the runs).')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    times = []
+    loaded = []
+    for _ in range(args.repeat):
+        total, loaded = importTime(args.module)
+        times.append(total)
+    best = min(times)
+    print(f'import {args.module}: best {best:.1f} ms, worst {max(times):.1f} ms, budget {args.budget:.1f} ms')
+
+    failed = False
+    heavy = sorted({i.strip() for i in loaded if i.strip().split('.')[0] in FORBIDDEN})
+    if heavy:
+        print(f'FAIL: forbidden modules loaded on import: {", ".join(heavy)}')
+        failed = True
+    if best > args.budget:
+        print('FAIL: import time over budget')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
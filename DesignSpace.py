@@ -0,0 +1,122 @@
+"""
+Lazy enumeration of (A, B, C, t, R[, fy]) grids with the geometric and code applicability checks applied per chunk.
+Only the feasible candidates are passed on to the gross and effective section calculations, the number of
+candidates rejected by every rule is counted.
+"""
+import numpy as np
+
+import BatchProperties as bprop
+import BatchRunner as br
+import EffectiveSection.EN1993_1_3.DistortionBucklingVec as DBv
+
+GEOMETRY = ('A', 'B', 'C', 't', 'R')
+
+
+def _flats(d):
+    # Straight parts of the web and the flanges must have a positive length, the lip is checked by lipRadius
+    return (d['a'] <= 0.0) | (d['b'] <= 0.0) | (d['tcore'] <= 0.0)
+
+
+# Rule name: (description, function of the lippedCDims dict returning True for the rejected candidates)
+RULES = {'flats': ('straight parts of web and flanges longer than zero, positive core thickness', _flats),
+         'lipRadius': ('lip longer than the corner radius', lambda d: d['c'] <= 0.0),
+         'edgeFold': ('flange b/t <= 60, EN 1993-1-3 Table 5.1 (checkEdgeFold)',
+                      lambda d: ~DBv.checkEdgeFold(d['bb'], d['tcore'], False)),
+         'ksig': ('lip bpc/bp <= 0.6, EN 1993-1-3 5.5.3.2(5)', lambda d: d['cc'] / d['bb'] > 0.6),
+         # Further geometric limits of EN 1993-1-3, not needed by the calculation
+         'lipRatio': ('lip c/b >= 0.2, EN 1993-1-3 5.2(2)', lambda d: d['cc'] / d['bb'] < 0.2),
+         'lipSlenderness': ('lip c/t <= 50, EN 1993-1-3 Table 5.1', lambda d: d['cc'] / d['tcore'] > 50.0),
+         'webSlenderness': ('web h/t <= 500, EN 1993-1-3 Table 5.1', lambda d: d['aa'] / d['tcore'] > 500.0)}
+# Rules applied by default, the candidates the calculation is not valid for. The further code limits are opt-in.
+DEFAULT_RULES = ('flats', 'lipRadius', 'edgeFold', 'ksig')
+
+
+def rejections(rows, rules=DEFAULT_RULES):
+    """
+    Rules violated by the candidates.
+    :param rows: Array with shape (n, 5) or (n, 6), columns A, B, C, t, R[, fy].
+    :return: dict of the rules, boolean arrays True for the rejected candidates.
+    """
+    rows = np.asarray(rows, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dims = bprop.lippedCDims(*rows[:, :len(GEOMETRY)].T)
+        return {name: np.asarray(RULES[name][1](dims), dtype=bool) for name in rules}
+
+
+class DesignSpace:
+    """
+    Grid of candidate sections, enumerated lazily in chunks of flat grid indices. Iterating yields the
+    feasible rows of every chunk, stats holds the counts of the finished iteration.
+    """
+
+    def __init__(self, grid, rules=DEFAULT_RULES, chunkSize: int = 4096):
+        """
+        :param grid: dict of A, B, C, t, R and optionally fy, each a sequence of values.
+        :param rules: Names of the applied RULES, e.g. tuple(RULES) for all code limits.
+        :param chunkSize: Candidates checked together.
+        """
+        missing = set(GEOMETRY) - set(grid)
+        if missing:
+            raise ValueError(f'Missing grid axes {sorted(missing)}.')
+        unknown = set(rules) - set(RULES)
+        if unknown:
+            raise ValueError(f'Unknown rules {sorted(unknown)}, use any of {tuple(RULES)}.')
+        if chunkSize < 1:
+            raise ValueError('Chunk size must be positive.')
+        self.names = GEOMETRY + (('fy',) if 'fy' in grid else ())
+        self.axes = [np.asarray(grid[name], dtype=float).reshape(-1) for name in self.names]
+        self.shape = tuple(len(i) for i in self.axes)
+        self.rules = tuple(rules)
+        self.chunkSize = chunkSize
+        self.stats = self._stats()
+
+    def _stats(self):
+        return {'candidates': 0, 'feasible': 0, 'rejected': 0, 'rules': {name: 0 for name in self.rules}}
+
+    def rows(self, index):
+        """Inputs of the flat grid indices, array with shape (n, 5) or (n, 6)."""
+        index = np.unravel_index(np.asarray(index, dtype=np.int64), self.shape)
+        return np.column_stack([axis[i] for axis, i in zip(self.axes, index)])
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    def __iter__(self):
+        """Arrays of the feasible rows of every chunk, chunks without a feasible row are skipped."""
+        for index, rows in self.feasible():
+            yield rows
+
+    def feasible(self):
+        """Flat grid indices and rows of the feasible candidates of every chunk, see __iter__."""
+        self.stats = stats = self._stats()
+        for start in range(0, len(self), self.chunkSize):
+            index = np.arange(start, min(start + self.chunkSize, len(self)))
+            rows = self.rows(index)
+            failed = rejections(rows, self.rules)
+            rejected = np.zeros(len(rows), dtype=bool)
+            for name, mask in failed.items():
+                stats['rules'][name] += int(np.sum(mask))
+                rejected |= mask
+            stats['candidates'] += len(rows)
+            stats['rejected'] += int(np.sum(rejected))
+            stats['feasible'] += int(np.sum(~rejected))
+            if not np.all(rejected):
+                yield index[~rejected], rows[~rejected]
+
+    def results(self, columns=None, jobs: int = 1):
+        """
+        Gross and effective properties of the feasible candidates, one dict of arrays per chunk. The grid needs
+        an fy axis.
+        :param columns: Result columns, see BatchRunner.calculate.
+        :param jobs: Number of processes.
+        """
+        if 'fy' not in self.names:
+            raise ValueError('The grid needs an fy axis for the effective section properties.')
+        yield from br.calculateChunks(iter(self), jobs, columns)
+
+    def report(self):
+        """Counts of the last iteration as text, a candidate may be rejected by several rules."""
+        s = self.stats
+        lines = [f'{s["candidates"]} candidates, {s["feasible"]} feasible, {s["rejected"]} rejected']
+        lines += [f'  {name}: {s["rules"][name]} ({RULES[name][0]})' for name in self.rules]
+        return '\n'.join(lines)
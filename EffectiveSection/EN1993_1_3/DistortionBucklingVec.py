@@ -0,0 +1,47 @@
+"""
+5.5.3.2 Plane elements with edge stiffeners, vectorized equivalents of the functions in DistortionBuckling.
+Warnings are returned as flag arrays instead of being printed.
+"""
+import numpy as np
+
+from EffectiveSection.EN1993_1_3.Sec5_5_3Vec import ksig
+
+
+def checkEdgeFold(b, t, doublefold):
+    """
+    This function checks the flange width to thickness ratio is ok or not.
+    :param doublefold: Double edge stiffener is True, may be an array.
+    :return: Edge stiffener is ok or not, bool array.
+    """
+    limit = np.where(np.asarray(doublefold, dtype=bool), 90, 60)
+    return ~(np.asarray(b, dtype=float) / t > limit)
+
+
+def effWidthofEdgeFold(bp, be2, t, rhoc, rhod, bpc, bpd, doublefold: bool):
+    """
+    This function calculates the effective width of the stiffener.
+    EN1993_1_3 section 5.5.3.2 Plane elements with edge stiffeners.
+    :return: [deff, ceff, As] for double edge folds, [ceff, As, ksc, flag] for single edge folds.
+    The flag is True for bpc/bp > 0.6, check EN1993_1_3 5.5.3.2 (5).
+    """
+    if doublefold:
+        deff = rhod * bpd
+        ceff = rhoc * bpc
+        As = t * (be2 + ceff + deff)
+        return [deff, ceff, As]
+    ceff = rhoc * bpc
+    As = t * (be2 + ceff)
+    ksc, flag = ksig(bpc, bp)
+    # DistortionBuckling.effWidthofEdgeFold returns 0 when the ratio is out of range
+    return [ceff, As, np.where(flag, 0.0, ksc), flag]
+
+
+def ksid(fy, sigmacrs):
+    """
+    This function calculates reduction factor ksid. EN1993_1_3 5.5.3.1 (7)
+    :return: The reduction factor.
+    """
+    lambdaD = np.sqrt(np.asarray(fy, dtype=float) / sigmacrs)
+    return np.select([lambdaD <= 0.65, (0.65 < lambdaD) & (lambdaD < 1.38), lambdaD >= 1.38],
+                     [1.0, 1.47 - 0.723 * lambdaD, 0.66 / lambdaD], np.nan)
+
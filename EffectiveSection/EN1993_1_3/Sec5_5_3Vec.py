@@ -0,0 +1,96 @@
+"""
+EN 1993-1-3 Section 5.5.3, vectorized equivalents of the functions in Sec5_5_3.
+Every function accepts scalars or arrays. Warnings are returned as flag arrays instead of being printed.
+"""
+import numpy as np
+
+import EffectiveSection.EN1993_1_5.Sec4Vec as Sec4v
+
+
+def ksig(bpc, bp):
+    """
+    EN 1993-1-3 Section 5.5.3.2(5)
+    :param bpc: Length of the lip.
+    :param bp: Length of the flange.
+    :return: Buckling factor, flag. Flag is True (and the buckling factor NaN) for bpc/bp > 0.6,
+    check EN1993_1_3 5.5.3.2 (5).
+    """
+    ratio = np.asarray(bpc, dtype=float) / np.asarray(bp, dtype=float)
+    with np.errstate(invalid='ignore'):
+        ksigma = np.select([ratio <= 0.35, (0.35 < ratio) & (ratio <= 0.60)],
+                           [0.5, 0.50 + 0.83 * np.abs(ratio - 0.35) ** (2.0 / 3.0)], np.nan)
+    return ksigma, np.isnan(ksigma)
+
+
+def calc_b1(b, be2, t, ceff):
+    return b - (be2 * t * be2 / 2) / ((be2 + ceff) * t)
+
+
+def springStiffnessK(E, t, v, b1, hw, b2, bending):
+    """
+    This function calculates the spring stiffness as per EN1993_1_3 5.5.3.1(5)
+    :param bending: Section is subjected to bending is True, may be an array.
+    :return: K spring stiffness
+    """
+    kf = np.where(np.asarray(bending, dtype=bool), 0, 1)
+    return (E * t ** 3) / (4 * (1 - v ** 2)) * (1 / (b1 ** 2 * hw + b1 ** 3 + 0.5 * b1 * b2 * hw * kf))
+
+
+def Is(be2, t, ceff):
+    return be2 * t ** 3 / 12 + ceff ** 3 * t / 12 + be2 * t * (ceff ** 2 / (2 * (be2 + ceff))) ** 2 + ceff * t * (
+            ceff / 2 - ceff ** 2 / (2 * (be2 + ceff))) ** 2
+
+
+def calc_scrs(K, Is, E, As):
+    return 2 * np.sqrt(K * E * Is) / As
+
+
+def thk_reduction(fy, scrs):
+    """
+    :return: Reduction factor for distortional buckling xd.
+    """
+    lamd = np.sqrt(np.asarray(fy, dtype=float) / scrs)
+    return np.select([lamd <= 0.65, (0.65 < lamd) & (lamd <= 1.38), lamd > 1.38],
+                     [1.0, 1.47 - 0.723 * lamd, 0.66 / lamd], np.nan)
+
+
+def edgeStiffener(bp, bpc, be2, t, hw, E, v, scomed, bending, lipComp=True, ksigma=None, ceff=None):
+    """
+    Edge stiffener chain of EN1993_1_3 5.5.3.2 for N stiffeners at once:
+    ksig -> lip effective width -> calc_b1 -> springStiffnessK -> Is -> calc_scrs -> thk_reduction.
+    :param bp: Flange width.
+    :param bpc: Lip length.
+    :param be2: Effective flange width next to the lip.
+    :param t: Thickness.
+    :param hw: Web height.
+    :param E: Elastic modulus.
+    :param v: Poisson's ratio.
+    :param scomed: Stress on the stiffener.
+    :param bending: Section is subjected to bending is True.
+    :param lipComp: Lip is under compression.
+    :param ksigma: Lip buckling factor, calculated with ksig when None.
+    :param ceff: Effective lip length, e.g. of a lip under a stress gradient. Calculated for uniform stress when
+    None.
+    :return: dict of arrays, ksigma, ceff, As, b1, K, Is, scrs, xd, t_red and the flags
+    'ksig' (bpc/bp > 0.6), 'edgeFold' (bp/t > 60) and 'invalid' (any NaN result).
+    """
+    kflag = None
+    if ksigma is None:
+        ksigma, kflag = ksig(bpc, bp)
+    if ceff is None:
+        # Lip under uniform stress, the stress ratio is 1.0
+        ceff, bc, bt, valid = Sec4v.outstandWidth(bpc, t, 1.0, scomed, lipComp, True, ksigma)
+    else:
+        valid = True
+    with np.errstate(invalid='ignore', divide='ignore'):
+        As = t * (be2 + ceff)
+        b1 = calc_b1(bp, be2, t, ceff)
+        K = springStiffnessK(E, t, v, b1, hw, b1, bending)
+        Ist = Is(be2, t, ceff)
+        scrs = calc_scrs(K, Ist, E, As)
+        xd = thk_reduction(scomed, scrs)
+    flags = {'ksig': np.isnan(ksigma) if kflag is None else kflag,
+             'edgeFold': np.asarray(bp, dtype=float) / t > 60,
+             'invalid': np.isnan(xd) | ~np.asarray(valid, dtype=bool)}
+    return {'ksigma': ksigma, 'ceff': ceff, 'As': As, 'b1': b1, 'K': K, 'Is': Ist,
+            'scrs': scrs, 'xd': xd, 't_red': xd * t, 'flags': flags}
@@ -0,0 +1,168 @@
+"""
+EN1993-1-5 Section 4.4, vectorized equivalents of the functions in Sec4.
+Every function accepts scalars or arrays. Branches are evaluated with masks, out-of-range inputs
+give NaN and False in the returned validity mask instead of the "No Value!" strings of Sec4.
+"""
+import numpy as np
+
+
+def _arrays(*values):
+    return np.broadcast_arrays(*(np.asarray(i, dtype=float) for i in values))
+
+
+def lamp(b, t, ksig, scomed, iscomp):
+    """
+    :param iscomp: is element under compression. True if compression.
+    :param b: element length
+    :param t: element thickness
+    :param ksig: bukcling factor
+    :param scomed: stress on element
+    :return: lambda, 0.0 for the elements which are not under compression.
+    """
+    b, t, ksig, scomed = _arrays(b, t, ksig, scomed)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lam = (b / t) / (28.4 * np.sqrt(235.0 / scomed) * np.sqrt(ksig))
+    return np.where(np.asarray(iscomp, dtype=bool), lam, 0.0)
+
+
+def internal_element(lamp, ff):
+    """
+    EN1993-1-5 Section 4.4(2) Equation 4.2
+    :param lamp: Relative slenderness.
+    :param ff: Stress ratio.
+    :return: rho, Reduction factor.
+    """
+    lamp, ff = _arrays(lamp, ff)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        limit = 0.5 + np.sqrt(0.085 - 0.055 * ff)
+        rho = np.minimum((lamp - 0.055 * (3 + ff)) / lamp ** 2, 1.0)
+        rho = np.where(lamp <= limit, 1.0, rho)
+    return np.where(np.isnan(lamp) | np.isnan(limit), np.nan, rho)
+
+
+def outstand_element(lamp):
+    """
+    EN1993-1-5 Section 4.4(2) Equation 4.3
+    :param lamp: Relative slenderness.
+    :return: rho, Reduction factor.
+    """
+    lamp = np.asarray(lamp, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = np.where(lamp <= 0.748, 1.0, np.minimum((lamp - 0.188) / lamp ** 2, 1.0))
+    return np.where(np.isnan(lamp), np.nan, rho)
+
+
+def stres_ratio(bcomp, bwhole):
+    bcomp, bwhole = _arrays(bcomp, bwhole)
+    return (bcomp - bwhole) / bcomp
+
+
+def Table4_1_ksigma(ff):
+    """
+    :param ff: stress ratio
+    :return: buckling factor, valid. Buckling factor is NaN for ff > 1.0 or ff <= -3.0.
+    """
+    ff = np.asarray(ff, dtype=float)
+    conditions = [ff == 1.0,
+                  (1.0 > ff) & (ff > 0.0),
+                  ff == 0.0,
+                  (0.0 > ff) & (ff > -1.0),
+                  ff == -1.0,
+                  (-1.0 > ff) & (ff > -3.0)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        choices = [4.0,
+                   8.2 / (1.05 + ff),
+                   7.81,
+                   7.81 - 6.29 * ff + 9.78 * ff ** 2,
+                   23.9,
+                   5.98 * (1.0 - ff) ** 2]
+    ksigma = np.select(conditions, choices, np.nan)
+    return ksigma, ~np.isnan(ksigma)
+
+
+def Table4_2_ksigma(ff, iscompend):
+    """
+    EN1993-1-5 Table 4.2
+    :param ff: stress ratio
+    :param iscompend: bool, If compression at the free end True.
+    :return: buckling factor, valid. Buckling factor is NaN for ff > 1.0 or ff < -1.0 when the free end
+    is not under compression.
+    """
+    ff, iscompend = np.broadcast_arrays(np.asarray(ff, dtype=float), np.asarray(iscompend, dtype=bool))
+    conditions = [iscompend,
+                  ff == 1.0,
+                  (1.0 > ff) & (ff > 0.0),
+                  ff == 0.0,
+                  (0.0 > ff) & (ff > -1.0),
+                  ff == -1.0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        choices = [0.57 - 0.21 * ff + 0.07 * ff ** 2,
+                   0.43,
+                   0.578 / (ff + 0.34),
+                   1.70,
+                   1.7 - 5.0 * ff + 17.1 * ff ** 2,
+                   23.8]
+    ksigma = np.select(conditions, choices, np.nan)
+    return ksigma, ~np.isnan(ksigma)
+
+
+def Table4_1_beff(ff, b, rho):
+    """
+    EN 1993-1-5 Table 4.1
+    :return: effective length, be1, be2, valid. NaN for ff > 1.0 or NaN inputs.
+    """
+    ff, b, rho = _arrays(ff, b, rho)
+    uniform = ff == 1.0
+    positive = (1.0 > ff) & (ff >= 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        beff = np.where(uniform | positive, rho * b, rho * b / (1 - ff))
+        be1 = np.select([uniform, positive], [0.5 * beff, 2 / (5 - ff) * beff], 0.4 * beff)
+        be2 = np.select([uniform, positive], [0.5 * beff, beff - be1], 0.6 * beff)
+    valid = (ff <= 1.0) & ~np.isnan(beff)
+    return np.where(valid, beff, np.nan), np.where(valid, be1, np.nan), np.where(valid, be2, np.nan), valid
+
+
+def Table4_2_beff(b, rho, ff):
+    """
+    EN1993-1-5 Table 4.2
+    :param ff: stress ratio
+    :param b: Element width.
+    :param rho: Reduction factor.
+    :return: effective length, length in compression side, length in tension side, valid.
+    NaN for ff > 1.0 or NaN inputs.
+    """
+    b, rho, ff = _arrays(b, rho, ff)
+    compressed = (1.0 >= ff) & (ff >= 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bc = np.where(compressed, b, b / (1 - ff))  # Compression part of the flat width
+        bt = np.where(compressed, 0.0, b - bc)  # Tension part of the flat width
+        beff = rho * bc
+    valid = (ff <= 1.0) & ~np.isnan(beff)
+    return np.where(valid, beff, np.nan), np.where(valid, bc, np.nan), np.where(valid, bt, np.nan), valid
+
+
+def internalWidth(b, t, ff, scomed, iscomp):
+    """
+    Effective width of internal elements, Table 4.1 buckling factor and Equation 4.2 in one call.
+    :return: beff, be1, be2, valid
+    """
+    ksigma, kvalid = Table4_1_ksigma(ff)
+    rho = internal_element(lamp(b, t, ksigma, scomed, iscomp), ff)
+    beff, be1, be2, valid = Table4_1_beff(ff, b, rho)
+    return beff, be1, be2, valid & kvalid
+
+
+def outstandWidth(b, t, ff, scomed, iscomp, iscompend, ksigma=None):
+    """
+    Effective width of outstand elements, Table 4.2 buckling factor and Equation 4.3 in one call.
+    :param ksigma: Buckling factor, if it is not calculated as per Table 4.2 (e.g. EN1993-1-3 5.5.3.2(5)).
+    :return: beff, bc, bt, valid
+    """
+    if ksigma is None:
+        ksigma, kvalid = Table4_2_ksigma(ff, iscompend)
+    else:
+        ksigma = np.asarray(ksigma, dtype=float)
+        kvalid = ~np.isnan(ksigma)
+    rho = outstand_element(lamp(b, t, ksigma, scomed, iscomp))
+    beff, bc, bt, valid = Table4_2_beff(b, rho, ff)
+    return beff, bc, bt, valid & kvalid
@@ -0,0 +1,88 @@
+"""
+Vectorized effective section calculations of the lipped C section for the four load modes of SectionProp_C.
+Every function evaluates N sections at once with Pipeline.EffectivePipeline. `geo` is the dict returned by
+geometry(), the other inputs are scalars or arrays with N values.
+"""
+import numpy as np
+
+import BatchProperties as bprop
+import EffectiveSection.Modes.Pipeline as Pipeline
+from EffectiveSection.Modes.Pipeline import E, v, elementMatrix, refineXd, _take  # noqa: F401
+
+
+def geometry(A, B, C, t, R):
+    """
+    Centreline dimensions and the gross centre of gravity needed by the load modes.
+    :return: dict of arrays with shape (N,), aa, bb, cc, tcore, zgx.
+    """
+    dims = bprop.lippedCDims(A, B, C, t, R)
+    geo = {key: dims[key].reshape(-1) for key in ('aa', 'bb', 'cc', 'tcore')}
+    geo['zgx'] = bprop.grossProps(A, B, C, t, R)['zgx'].reshape(-1)
+    return geo
+
+
+def _run(mode, geo, f, **kwargs):
+    return Pipeline.EffectivePipeline(geo, f, E, v, **kwargs).run(mode)
+
+
+def axialCompression(geo, f, iterate=False, tol=1e-4, maxIter=20, xd0=None):
+    """
+    Effective section under axial compression, see SectionProp_C.calcs_AxialCompression.
+    :param iterate: Refine the distortional reduction factor iteratively, EN1993-1-3 5.5.3.2(10).
+    :param xd0: Starting reduction factor of the iteration, e.g. the converged value of a neighbour section.
+    :return: dict of arrays, see Pipeline.EffectivePipeline.run.
+    """
+    return _run('AxialCompression', geo, f, iterate=iterate, tol=tol, maxIter=maxIter, xd0=xd0)
+
+
+def bendingStrong(geo, f, iterate=False, tol=1e-4, maxIter=20, xd0=None, iterateNA=False, naTol=1e-3,
+                  naMaxIter=20):
+    """
+    Effective section under bending about the strong axis, see SectionProp_C.calcs_BendingStrong.
+    :param iterateNA: Repeat the web reduction with the neutral axis of the effective section until the
+    neutral axis moves less than naTol (mm). Only the sections which are not converged are iterated.
+    :return: dict of arrays, see Pipeline.EffectivePipeline.run.
+    """
+    return _run('BendingStrong', geo, f, iterate=iterate, tol=tol, maxIter=maxIter, xd0=xd0,
+                iterateNA=iterateNA, naTol=naTol, naMaxIter=naMaxIter)
+
+
+def bendingWeakLip(geo, f, iterate=False, tol=1e-4, maxIter=20, xd0=None):
+    """
+    Effective section under bending about the weak axis, lips are under compression,
+    see SectionProp_C.calcs_BendingWeakLip.
+    :return: dict of arrays, see Pipeline.EffectivePipeline.run.
+    """
+    return _run('BendingWeakLip', geo, f, iterate=iterate, tol=tol, maxIter=maxIter, xd0=xd0)
+
+
+def bendingWeakWeb(geo, f, iterate=False, tol=1e-4, maxIter=20, xd0=None):
+    """
+    Effective section under bending about the weak axis, web is under compression,
+    see SectionProp_C.calcs_BendingWeakWeb.
+    :return: dict of arrays, see Pipeline.EffectivePipeline.run.
+    """
+    return _run('BendingWeakWeb', geo, f, iterate=iterate, tol=tol, maxIter=maxIter, xd0=xd0)
+
+
+MODE_FUNCTIONS = {'AxialCompression': axialCompression,
+                  'BendingStrong': bendingStrong,
+                  'BendingWeakLip': bendingWeakLip,
+                  'BendingWeakWeb': bendingWeakWeb}
+
+
+def sweepRefined(mode: str, geo, f, stride: int = 8, **kwargs):
+    """
+    Iteratively refined results of a sweep of neighbouring sections. Every stride-th section is solved from the
+    single pass value, the others start from the converged reduction factor of the preceding solved section.
+    :param mode: One of MODE_FUNCTIONS.
+    :param kwargs: tol, maxIter
+    :return: dict of arrays, see the mode functions.
+    """
+    func = MODE_FUNCTIONS[mode]
+    n = len(geo['bb'])
+    f = np.broadcast_to(np.asarray(f, dtype=float), (n,))
+    seeds = np.arange(0, n, stride)
+    seeded = func(_take(geo, seeds), f[seeds], iterate=True, **kwargs)
+    xd0 = np.repeat(seeded['xd_top'], stride)[:n]
+    return func(geo, f, iterate=True, xd0=xd0, **kwargs)
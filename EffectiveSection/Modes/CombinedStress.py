@@ -0,0 +1,103 @@
+"""
+Effective section of the lipped C section under a linear stress distribution of combined N + My + Mz.
+The stress ratio of every plate element is taken from the gross section stresses at its edges, and the
+effective section is calculated with Pipeline.EffectivePipeline for N sections or load points at once.
+Compression is positive. My compresses the top flange, Mz compresses the lips.
+"""
+import numpy as np
+
+import EffectiveSection.Modes.Pipeline as Pipeline
+
+AXES = ('strong', 'weakLip', 'weakWeb')
+# EN 1993-1-5 Table 4.1 is given for stress ratios above -3. Lower ratios are taken as the limit, which gives a
+# larger compression zone (conservative).
+FF_MIN = -3.0 + 1e-9
+
+
+def nodeStresses(geo, gross, N, My, Mz):
+    """
+    Gross section stresses at the plate edges, EN 1993-1-5 4.4(3).
+    :param geo: dict of arrays, see BatchModes.geometry.
+    :param gross: dict of arrays, Ag, Ix, Iy, zgx, zgy, see BatchProperties.grossProps.
+    :return: dict of arrays, botLipEnd, botCorner, webBot, webTop, topCorner, topLipEnd.
+    """
+    aa, bb, cc = geo['aa'], geo['bb'], geo['cc']
+    Ag, Ix, Iy, zgx, zgy = (np.reshape(gross[i], -1) for i in ('Ag', 'Ix', 'Iy', 'zgx', 'zgy'))
+    points = {'botLipEnd': (bb, cc), 'botCorner': (bb, 0.0), 'webBot': (0.0, 0.0), 'webTop': (0.0, aa),
+              'topCorner': (bb, aa), 'topLipEnd': (bb, aa - cc)}
+    return {name: N / Ag + My * (y - zgy) / Ix + Mz * (x - zgx) / Iy for name, (x, y) in points.items()}
+
+
+def _plate(s1, s2, edge1: str, edge2: str):
+    # Stress ratio, compression and the edge with the larger compression of a plate with the edge stresses s1, s2
+    big, small = np.maximum(s1, s2), np.minimum(s1, s2)
+    comp = big > 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ff = np.where(comp, np.maximum(small / big, FF_MIN), 1.0)
+    return ff, comp, np.where(s1 >= s2, edge1, edge2)
+
+
+def stressSpec(stresses):
+    """
+    Pipeline specification of the stress distribution.
+    :param stresses: dict of arrays, see nodeStresses.
+    """
+    spec = {}
+    for name, other in (('top', 'bot'), ('bot', 'top')):
+        corner, lipEnd = stresses[f'{name}Corner'], stresses[f'{name}LipEnd']
+        web = stresses['webTop' if name == 'top' else 'webBot']
+        ff, comp, sigma1 = _plate(web, corner, 'web', 'lip')
+        flange = Pipeline.flange('internal', ff, comp, sigma1)
+        ff, comp, sigma1 = _plate(corner, lipEnd, 'corner', 'end')
+        lip = Pipeline.lip(ff, comp, sigma1)
+        # Axial compression only if both stiffeners are under the same compression, EN 1993-1-3 5.5.3.1(5)
+        bending = ~(np.isclose(corner, stresses[f'{other}Corner']) & (corner > 0.0))
+        spec[name] = Pipeline.side(flange, lip, bending, reduce=corner > 0.0)
+    ff, comp, sigma1 = _plate(stresses['webTop'], stresses['webBot'], 'top', 'bot')
+    spec['web'] = Pipeline.web('uniform', ff, comp, sigma1)
+    return spec
+
+
+def combinedStress(geo, gross, f, N, My, Mz, **kwargs):
+    """
+    Effective section under the stress distribution of N, My and Mz. The largest compression is f, the
+    magnitudes of N, My and Mz define only the shape of the distribution.
+    :param kwargs: Options of Pipeline.EffectivePipeline, e.g. iterate.
+    :return: dict of arrays, see Pipeline.EffectivePipeline.run. Wxeff and Wyeff are given for the
+    extreme fibres, eNx and eNy are the shifts of the centre of gravity from the gross section.
+    """
+    n = len(geo['bb'])
+    N, My, Mz = (np.broadcast_to(np.asarray(i, dtype=float), (n,)) for i in (N, My, Mz))
+    res = Pipeline.EffectivePipeline(geo, f, **kwargs).run(stressSpec(nodeStresses(geo, gross, N, My, Mz)))
+    res['Wxeff'] = res['Ixeff'] / np.maximum(res['ygc'], res['ygct'])
+    res['eNx'] = res['xgc'] - np.reshape(gross['zgx'], -1)
+    res['eNy'] = res['ygc'] - np.reshape(gross['zgy'], -1)
+    return res
+
+
+def interactionCurve(geo, gross, f, ratios, axis: str = 'strong', **kwargs):
+    """
+    Effective sections along an N - M interaction curve, all points of all sections in one call.
+    At the ratio r the extreme fibre stress is (1 - r) from N and r from the moment, r = 0 is axial compression
+    and r = 1 is pure bending.
+    :param ratios: Points of the curve, values between 0.0 and 1.0.
+    :param axis: 'strong', 'weakLip' (lips under compression) or 'weakWeb' (web under compression).
+    :return: dict of arrays with shape (sections, points), see combinedStress.
+    """
+    if axis not in AXES:
+        raise ValueError(f'Unknown axis {axis}, use one of {AXES}.')
+    ratios = np.asarray(ratios, dtype=float).reshape(-1)
+    m, k = len(geo['bb']), len(ratios)
+    grossp = {key: np.repeat(np.reshape(gross[key], -1), k) for key in ('Ag', 'Ix', 'Iy', 'zgx', 'zgy')}
+    geop = {key: np.repeat(value, k) for key, value in geo.items()}
+    r = np.tile(ratios, m)
+    M = np.zeros(m * k)
+    if axis == 'strong':
+        My, Mz = r * grossp['Ix'] / (geop['aa'] - grossp['zgy']), M
+    elif axis == 'weakLip':
+        My, Mz = M, r * grossp['Iy'] / (geop['bb'] - grossp['zgx'])
+    else:
+        My, Mz = M, -r * grossp['Iy'] / grossp['zgx']
+    res = combinedStress(geop, grossp, np.repeat(np.broadcast_to(f, (m,)), k), (1.0 - r) * grossp['Ag'], My, Mz,
+                         **kwargs)
+    return {key: value.reshape((m, k) + value.shape[1:]) for key, value in res.items()}
@@ -0,0 +1,381 @@
+"""
+Shared effective section pipeline of the lipped C section.
+A load mode is a stress specification of every plate element (flanges, lips, web). The pipeline evaluates
+N sections at once and keeps the intermediate results, so the plates and stiffeners which are loaded the
+same way in several modes are calculated only once.
+
+Section parts
+        6       7
+      ┌────   ────┐    ↑
+      │           │ 8  │
+      │ 5              hc
+                       │
+      │                ↓
+    --│-------------------
+      │
+      │ 4
+      │           │ 1
+      └────   ────┘
+         3      2
+"""
+import numpy as np
+
+import EffectiveSection.EN1993_1_5.Sec4Vec as Sec4v
+import EffectiveSection.EN1993_1_3.Sec5_5_3Vec as Sec553v
+from EffectiveSection.Modes.IntCalcProp import calcPropsBatch
+
+E = 210000.0  # MPa
+v = 0.3  # Poisson's ratio
+
+
+def flange(kind: str = 'internal', ff=1.0, comp: bool = True, sigma1: str = 'web'):
+    """
+    Stress specification of a flange. ff, comp and sigma1 may be arrays with a value for every section.
+    :param kind: 'internal' EN 1993-1-5 Table 4.1, 'weakLip' Table 4.2 buckling factor with the lips under
+    compression, 'tension' only the part in tension (bb - zgx) is taken into account.
+    :param ff: Stress ratio.
+    :param comp: Flange is under compression.
+    :param sigma1: Edge with the larger compression stress, 'web' or 'lip'.
+    """
+    return {'kind': kind, 'ff': ff, 'comp': comp, 'sigma1': sigma1}
+
+
+def lip(ff=1.0, comp: bool = True, sigma1: str = 'corner'):
+    """
+    Stress specification of a lip (edge fold).
+    :param sigma1: Edge with the larger compression stress, 'corner' or 'end' (free end).
+    """
+    return {'ff': ff, 'comp': comp, 'sigma1': sigma1}
+
+
+def web(kind: str = 'uniform', ff=1.0, comp: bool = True, sigma1: str = 'top'):
+    """
+    Stress specification of the web.
+    :param kind: 'uniform' the stress ratio is given, 'neutralAxis' the compressed height is found from the
+    neutral axis of the effective flanges and lips (strong axis bending, top under compression).
+    :param sigma1: Edge with the larger compression stress, 'top' or 'bot'. ff, comp and sigma1 may be arrays.
+    """
+    return {'kind': kind, 'ff': ff, 'comp': comp, 'sigma1': sigma1}
+
+
+def side(flangeSpec, lipSpec, bending: bool, reduce: bool = True):
+    """
+    Stress specification of a flange with its edge stiffener.
+    :param bending: Section is subjected to bending, see Sec5_5_3.springStiffnessK.
+    :param reduce: Thickness of the stiffener is reduced for distortional buckling.
+    bending and reduce may be arrays with a value for every section.
+    """
+    return {'flange': flangeSpec, 'lip': lipSpec, 'bending': bending, 'reduce': reduce}
+
+
+MODE_SPECS = {
+    'AxialCompression': {'top': side(flange(), lip(), False),
+                         'bot': side(flange(), lip(), False),
+                         'web': web()},
+    'BendingStrong': {'top': side(flange(), lip(), True),
+                      'bot': side(flange(comp=False), lip(comp=False), True, reduce=False),
+                      'web': web('neutralAxis')},
+    'BendingWeakLip': {'top': side(flange('weakLip'), lip(), False),
+                       'bot': side(flange('weakLip'), lip(), False),
+                       'web': web(comp=False)},
+    'BendingWeakWeb': {'top': side(flange('tension'), lip(comp=False), True),
+                       'bot': side(flange('tension'), lip(comp=False), True, reduce=False),
+                       'web': web()},
+}
+
+
+def elementMatrix(geo, bot_lip_beff, bot_flg_be2, bot_flg_be1, bot_t_red, h2, h1, top_flg_be1, top_flg_be2,
+                  top_lip_beff, top_t_red, web=True):
+    """
+    Effective element matrices from bottom lip to top lip.
+    0 id , 1 inodeX, 2 inodeY, 3 jnodeX, 4 JnodeY, 5 thickness
+    :param web: False gives zero thickness to the web elements 4 and 5.
+    :return: Array with shape (N, 8, 6)
+    """
+    bb, aa, tcore = geo['bb'], geo['aa'], geo['tcore']
+    n = len(bb)
+    tw = tcore if web else np.zeros(n)
+    rows = [[1, bb, bot_lip_beff, bb, 0.0, bot_t_red],
+            [2, bb, 0.0, bb - bot_flg_be2, 0.0, bot_t_red],
+            [3, bot_flg_be1, 0.0, 0.0, 0.0, tcore],
+            [4, 0.0, 0.0, 0.0, h2, tw],
+            [5, 0.0, aa - h1, 0.0, aa, tw],
+            [6, 0.0, aa, top_flg_be1, aa, tcore],
+            [7, bb - top_flg_be2, aa, bb, aa, top_t_red],
+            [8, bb, aa, bb, aa - top_lip_beff, top_t_red]]
+    data = np.empty([n, 8, 6])
+    for i, row in enumerate(rows):
+        for j, value in enumerate(row):
+            data[:, i, j] = value
+    return data
+
+
+def refineXd(step, xd, tol: float = 1e-4, maxIter: int = 20):
+    """
+    Iterative refinement of the distortional reduction factor, EN1993-1-3 5.5.3.2(10).
+    Only the sections which are not converged yet are passed to `step`.
+    :param step: Function (index, xd) returning the new xd of the sections in index.
+    :param xd: Starting values.
+    :return: xd, number of iterations, converged mask.
+    """
+    xd = np.array(xd, dtype=float)
+    iterations = np.zeros(len(xd), dtype=int)
+    active = np.arange(len(xd))
+    converged = np.zeros(len(xd), dtype=bool)
+    for _ in range(maxIter):
+        if not len(active):
+            break
+        new = step(active, xd[active])
+        done = np.abs(new - xd[active]) <= tol
+        xd[active] = new
+        iterations[active] += 1
+        converged[active[done]] = True
+        active = active[~done]
+    return xd, iterations, converged
+
+
+def _key(spec):
+    # Hashable key of a specification, array stress ratios are keyed by their values
+    if isinstance(spec, dict):
+        return tuple((name, _key(value)) for name, value in sorted(spec.items()))
+    if isinstance(spec, np.ndarray):
+        return spec.shape, spec.tobytes()
+    return spec
+
+
+def _take(values, index):
+    return {key: value[index] for key, value in values.items()}
+
+
+def _takeSpec(spec, index):
+    # Specification of the sections in index, scalar values are kept
+    if isinstance(spec, dict):
+        return {name: _takeSpec(value, index) for name, value in spec.items()}
+    if isinstance(spec, np.ndarray) and spec.ndim:
+        return spec[index]
+    return spec
+
+
+def _swap(sigma1, value):
+    # Mask of the sections where the larger compression is at the edge `value`
+    return np.asarray(sigma1) == value
+
+
+def _tensionPart(b, ff):
+    # Tension part of the flat width, Table 4.1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(ff < 0.0, b - b / (1 - ff), 0.0)
+
+
+class EffectivePipeline:
+    """
+    Effective sections of N lipped C sections under the design stress f.
+    Results of flanges, lips, stiffeners and webs are kept by their stress specification and reused.
+    """
+
+    def __init__(self, geo, f, E: float = E, v: float = v, iterate: bool = False, tol: float = 1e-4,
+                 maxIter: int = 20, xd0=None, iterateNA: bool = False, naTol: float = 1e-3, naMaxIter: int = 20):
+        """
+        :param geo: dict of arrays with shape (N,), aa, bb, cc, tcore, zgx. See BatchModes.geometry.
+        :param f: Design stress.
+        :param iterate: Refine the distortional reduction factor iteratively, EN1993-1-3 5.5.3.2(10).
+        :param xd0: Starting reduction factor of the iteration, e.g. the converged value of a neighbour section.
+        :param iterateNA: Repeat the web reduction of 'neutralAxis' webs until the neutral axis moves less
+        than naTol (mm).
+        """
+        self.geo = {key: np.asarray(value, dtype=float).reshape(-1) for key, value in geo.items()}
+        self.n = len(self.geo['bb'])
+        self.f = np.broadcast_to(np.asarray(f, dtype=float), (self.n,))
+        self.E = E
+        self.v = v
+        self.iterate = iterate
+        self.tol = tol
+        self.maxIter = maxIter
+        self.xd0 = xd0
+        self.iterateNA = iterateNA
+        self.naTol = naTol
+        self.naMaxIter = naMaxIter
+        self._memo = {}
+        # Number of calculated and reused intermediates
+        self.stats = {'calculated': 0, 'reused': 0}
+
+    def _cached(self, key, func):
+        if key in self._memo:
+            self.stats['reused'] += 1
+        else:
+            self.stats['calculated'] += 1
+            self._memo[key] = func()
+        return self._memo[key]
+
+    # ==================================================================================================================
+    # PLATE ELEMENTS
+    # ==================================================================================================================
+    def _flange(self, spec, geo, sf):
+        """
+        Effective flange parts next to the web and next to the lip.
+        :return: web side length, lip side length
+        """
+        bb, tcore = geo['bb'], geo['tcore']
+        if spec['kind'] == 'tension':
+            # Only tension part is taken into account for the flange (bb-zgx)
+            return np.zeros(len(bb)), bb - geo['zgx']
+        if spec['kind'] == 'weakLip':
+            ksigma, valid = Sec4v.Table4_2_ksigma(spec['ff'], True)
+            rho = Sec4v.internal_element(Sec4v.lamp(bb, tcore, ksigma, sf, spec['comp']), spec['ff'])
+            return geo['zgx'], Sec4v.Table4_2_beff(bb, rho, spec['ff'])[0]
+        beff, be1, be2, valid = Sec4v.internalWidth(bb, tcore, spec['ff'], sf, spec['comp'])
+        be2 = be2 + _tensionPart(bb, spec['ff'])
+        swap = _swap(spec['sigma1'], 'lip')
+        return np.where(swap, be2, be1), np.where(swap, be1, be2)
+
+    def _ksig(self):
+        # Lip buckling factor, EN 1993-1-3 5.5.3.2(5), depends on the geometry only
+        return self._cached(('ksig',), lambda: Sec553v.ksig(self.geo['cc'], self.geo['bb'])[0])
+
+    def _lip(self, spec, geo, sf, ksigma):
+        # Effective length from the corner. If the corner is on the tension side the tension part next to the
+        # corner is effective as well, a tension part at the free end is neglected.
+        ceff, bc, bt, valid = Sec4v.outstandWidth(geo['cc'], geo['tcore'], spec['ff'], sf, spec['comp'], True,
+                                                  ksigma)
+        return ceff + np.where(_swap(spec.get('sigma1', 'corner'), 'end'), bt, 0.0)
+
+    def _stiffener(self, geo, f, be2, ceff, bending, ksigma, key=None):
+        """
+        Edge stiffener with the effective parts be2 and ceff, see Sec5_5_3Vec.edgeStiffener.
+        :return: dict of arrays, xd is the distortional reduction factor, flags the dict of the warning flags.
+        """
+        def chain():
+            return Sec553v.edgeStiffener(geo['bb'], geo['cc'], be2, geo['tcore'], geo['aa'], self.E, self.v, f,
+                                         bending, ksigma=ksigma, ceff=ceff)
+
+        if key is None:
+            return chain()
+        return self._cached(('stiffener', _key(bending)) + key, chain)
+
+    def side(self, spec):
+        """
+        Flange and edge stiffener of one side of the section.
+        :return: dict of arrays, webPart, lipPart (flange lengths), ceff, xd, t_red, iterations, converged and flags
+        (dict of the warning flags of Sec5_5_3Vec.edgeStiffener). converged is False for the sections whose xd
+        iteration stopped at maxIter, True without iteration. xd is the last value tested against tol.
+        """
+        return self._cached(('side', _key(spec)), lambda: self._side(spec))
+
+    def _side(self, spec):
+        geo, f = self.geo, self.f
+        ksigma = self._ksig()
+        fkey = ('flange', _key(spec['flange']))
+        lkey = ('lip', _key(spec['lip']))
+        webPart, lipPart = self._cached(fkey, lambda: self._flange(spec['flange'], geo, f))
+        ceff = self._cached(lkey, lambda: self._lip(spec['lip'], geo, f, ksigma))
+        iterations = np.zeros(self.n, dtype=int)
+        converged = np.ones(self.n, dtype=bool)
+        reduce = np.broadcast_to(np.asarray(spec['reduce'], dtype=bool), (self.n,))
+        if not reduce.any():
+            xd = np.ones(self.n)
+            flags = {'ksig': np.isnan(ksigma), 'edgeFold': geo['bb'] / geo['tcore'] > 60,
+                     'invalid': np.zeros(self.n, dtype=bool)}
+            return {'webPart': webPart, 'lipPart': lipPart, 'ceff': ceff, 'xd': xd, 't_red': geo['tcore'],
+                    'iterations': iterations, 'converged': converged, 'flags': flags}
+
+        def solve(index, xdi):
+            # Plate slenderness with the stress xd.fy, reduction factor for the stress fy
+            g, s = _take(geo, index), _takeSpec(spec, index)
+            wp, lp = self._flange(s['flange'], g, xdi * f[index])
+            ce = self._lip(s['lip'], g, xdi * f[index], ksigma[index])
+            return wp, lp, ce, self._stiffener(g, f[index], lp, ce, s['bending'], ksigma[index])
+
+        if self.xd0 is None:
+            stiffener = self._stiffener(geo, f, lipPart, ceff, spec['bending'], ksigma, fkey + lkey)
+        else:
+            webPart, lipPart, ceff, stiffener = solve(slice(None), np.where(reduce, self.xd0, 1.0))
+        xd = np.where(reduce, stiffener['xd'], 1.0)
+        if self.iterate:
+            xd, iterations, converged = refineXd(
+                lambda index, xdi: np.where(reduce[index], solve(index, xdi)[3]['xd'], 1.0), xd, self.tol,
+                self.maxIter)
+            # Effective parts at the stress of the last tested xd, the stiffener result is only used for the flags
+            webPart, lipPart, ceff, stiffener = solve(slice(None), xd)
+        flags = dict(stiffener['flags'], invalid=stiffener['flags']['invalid'] & reduce)
+        return {'webPart': webPart, 'lipPart': lipPart, 'ceff': ceff, 'xd': xd, 't_red': xd * geo['tcore'],
+                'iterations': iterations, 'converged': converged, 'flags': flags}
+
+    def _web(self, spec, geo, sf, hc=None):
+        """
+        Effective web parts at the top and at the bottom.
+        :param hc: Compressed height of 'neutralAxis' webs.
+        :return: h1 (top), h2 (bottom)
+        """
+        aa = geo['aa']
+        ff = (hc - aa) / hc if spec['kind'] == 'neutralAxis' else spec['ff']
+        beff, be1, be2, valid = Sec4v.internalWidth(aa, geo['tcore'], ff, sf, spec['comp'])
+        be2 = be2 + _tensionPart(aa, ff)
+        swap = _swap(spec['sigma1'], 'bot')
+        return np.where(swap, be2, be1), np.where(swap, be1, be2)
+
+    # ==================================================================================================================
+    # EFFECTIVE SECTION
+    # ==================================================================================================================
+    def elementMatrix(self, spec, index=slice(None), h1=None, h2=None):
+        """
+        Effective element matrix of the specification, with the web parts h1 and h2 if they are given.
+        """
+        top, bot = self.side(spec['top']), self.side(spec['bot'])
+        geo = _take(self.geo, index)
+        hasWeb = h1 is not None
+        if not hasWeb:
+            h1 = h2 = np.zeros(len(geo['bb']))
+        return elementMatrix(geo, bot['ceff'][index], bot['lipPart'][index], bot['webPart'][index],
+                             bot['t_red'][index], h2, h1, top['webPart'][index], top['lipPart'][index],
+                             top['ceff'][index], top['t_red'][index], web=hasWeb)
+
+    def run(self, mode):
+        """
+        Effective section of a load mode.
+        :param mode: Name in MODE_SPECS or a specification dict with 'top', 'bot' (see side) and 'web' (see web).
+        :return: dict of arrays, elementData2, Aeff, ygc, ygct, xgc, xgct, dxgc, Ixeff, Wxeff, Iyeff, Wyeff,
+        Ixy, xd_top, xd_bot, converged_top, converged_bot, iterations, naIterations, naConverged. The converged
+        flags are False for the sections whose xd (top, bot) or neutral axis iteration stopped at the maximum
+        number of iterations.
+        """
+        spec = MODE_SPECS[mode] if isinstance(mode, str) else mode
+        return self._cached(('mode', _key(spec)), lambda: self._run(spec))
+
+    def _run(self, spec):
+        geo, f = self.geo, self.f
+        index = np.arange(self.n)
+        naIterations = np.zeros(self.n, dtype=int)
+        naConverged = np.ones(self.n, dtype=bool)
+        if spec['web']['kind'] == 'neutralAxis':
+            # Neutral axis of the section without the web elements 4 and 5
+            ht = calcPropsBatch(self.elementMatrix(spec))[1]
+            h1, h2 = self._web(spec['web'], geo, f, geo['aa'] - ht)
+        else:
+            h1, h2 = self._cached(('web', _key(spec['web'])), lambda: self._web(spec['web'], geo, f))
+        data = self.elementMatrix(spec, index, h1, h2)
+        Aeff, ygc, Ixeff, xgc, Iyeff, Ixy = calcPropsBatch(data)
+        if self.iterateNA and spec['web']['kind'] == 'neutralAxis':
+            active = index
+            naConverged = np.zeros(self.n, dtype=bool)
+            for _ in range(self.naMaxIter):
+                if not len(active):
+                    break
+                g = _take(geo, active)
+                h1a, h2a = self._web(_takeSpec(spec['web'], active), g, f[active], g['aa'] - ygc[active])
+                da = self.elementMatrix(spec, active, h1a, h2a)
+                new = calcPropsBatch(da)[1]
+                done = np.abs(new - ygc[active]) <= self.naTol
+                data[active] = da
+                ygc[active] = new
+                naIterations[active] += 1
+                naConverged[active[done]] = True
+                active = active[~done]
+            Aeff, ygc, Ixeff, xgc, Iyeff, Ixy = calcPropsBatch(data)
+        top, bot = self.side(spec['top']), self.side(spec['bot'])
+        xgct = geo['bb'] - xgc
+        return {'elementData2': data, 'Aeff': Aeff, 'ygc': ygc, 'ygct': geo['aa'] - ygc, 'xgc': xgc,
+                'xgct': xgct, 'dxgc': xgc - geo['zgx'], 'Ixeff': Ixeff, 'Wxeff': Ixeff / (geo['aa'] - ygc),
+                'Iyeff': Iyeff, 'Wyeff': Iyeff / np.maximum(xgc, xgct), 'Ixy': Ixy,
+                'xd_top': top['xd'], 'xd_bot': bot['xd'], 'converged_top': top['converged'],
+                'converged_bot': bot['converged'], 'iterations': np.maximum(top['iterations'], bot['iterations']),
+                'naIterations': naIterations, 'naConverged': naConverged}
@@ -0,0 +1,234 @@
+"""
+Semi-analytical finite strip method (FSM) for the elastic buckling of open thin-walled sections, simply supported
+ends with one half-wave along the length (signature curve).
+Input are the CUFSM-style nodes [id, x, y, DOF flags x, y, longitudinal, rotation, stress] and
+elements [id, node i, node j, thickness, material] arrays, see ThinWalled.
+Strip displacements: u (across) and w (out of plane) vary with sin(πy/a), v (longitudinal) with cos(πy/a).
+The integrals along the strip are analytic, the integrals across the strip use Gauss quadrature.
+"""
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import eigsh
+
+import ThinWalled as tw
+
+E = 210000.0  # MPa
+v = 0.3  # Poisson's ratio
+
+# Exact for the cubic shape functions squared times the linear stress of the geometric stiffness
+GAUSS_X, GAUSS_W = np.polynomial.legendre.leggauss(4)
+# Global DOFs of a node: x, y, longitudinal, rotation, the order of the flag columns 3-6
+NODE_DOFS = 4
+
+
+def _shapes(b):
+    """
+    Shape function rows at the Gauss points across the strips, local DOFs [u1, v1, u2, v2, w1, θ1, w2, θ2].
+    :param b: Strip widths, shape (elements,).
+    :return: dict of arrays with shape (elements, points, 8).
+    """
+    xi = (1.0 + GAUSS_X) / 2.0
+    b = b[:, np.newaxis]
+    zero = np.zeros(np.broadcast_shapes(b.shape, xi.shape))
+    one = zero + 1.0
+
+    def rows(*cols):
+        return np.stack([zero + i for i in cols], axis=-1)
+
+    lin1, lin2 = one - xi, zero + xi
+    return {'u': rows(lin1, 0, lin2, 0, 0, 0, 0, 0),
+            'v': rows(0, lin1, 0, lin2, 0, 0, 0, 0),
+            'du': rows(-1 / b, 0, 1 / b, 0, 0, 0, 0, 0),
+            'dv': rows(0, -1 / b, 0, 1 / b, 0, 0, 0, 0),
+            'w': rows(0, 0, 0, 0, 1 - 3 * xi ** 2 + 2 * xi ** 3, b * (xi - 2 * xi ** 2 + xi ** 3),
+                      3 * xi ** 2 - 2 * xi ** 3, b * (xi ** 3 - xi ** 2)),
+            'dw': rows(0, 0, 0, 0, (-6 * xi + 6 * xi ** 2) / b, 1 - 4 * xi + 3 * xi ** 2,
+                       (6 * xi - 6 * xi ** 2) / b, 3 * xi ** 2 - 2 * xi),
+            'ddw': rows(0, 0, 0, 0, (-6 + 12 * xi) / b ** 2, (-4 + 6 * xi) / b, (6 - 12 * xi) / b ** 2,
+                        (6 * xi - 2) / b)}
+
+
+def _integrate(b, f):
+    # Integral across the strips of f with shape (elements, points, ...)
+    w = GAUSS_W * b[:, np.newaxis] / 2.0
+    return np.einsum('ep,ep...->e...', w, f)
+
+
+def _transform(c, s):
+    """Local [u1, v1, u2, v2, w1, θ1, w2, θ2] from global [x1, y1, v1, θ1, x2, y2, v2, θ2], (elements, 8, 8)."""
+    T = np.zeros(c.shape + (8, 8))
+    for node in (0, 1):
+        g = 4 * node
+        T[:, 2 * node, g], T[:, 2 * node, g + 1] = c, s
+        T[:, 2 * node + 1, g + 2] = 1.0
+        T[:, 4 + 2 * node, g], T[:, 4 + 2 * node, g + 1] = -s, c
+        T[:, 5 + 2 * node, g + 3] = 1.0
+    return T
+
+
+def elementBlocks(nodes, elements, stress=None, E: float = E, v: float = v):
+    """
+    Length-independent parts of the strip matrices in global coordinates, vectorized over the elements.
+    With km = π / a the matrices of the half-wavelength a are k = a / 2 Σ km^p k[:, p] and kg = a / 2 km² g.
+    :param stress: Reference stress of the nodes, compression positive. Column 7 of nodes if None.
+    :return: k with shape (elements, 5, 8, 8), g with shape (elements, 8, 8), dofs global DOF numbers with
+    shape (elements, 8).
+    """
+    nodes, elements = np.asarray(nodes, dtype=float), np.asarray(elements, dtype=float)
+    stress = nodes[:, 7] if stress is None else np.asarray(stress, dtype=float)
+    i, j = elements[:, 1].astype(int), elements[:, 2].astype(int)
+    t = elements[:, 3]
+    dx, dy = nodes[j, 1] - nodes[i, 1], nodes[j, 2] - nodes[i, 2]
+    b = np.hypot(dx, dy)
+    if not np.all(b > 0.0):
+        raise ValueError(f'Elements {elements[b <= 0.0, 0].astype(int).tolist()} have zero length, '
+                         'the strip matrices need distinct end nodes.')
+    N = _shapes(b)
+    zero = np.zeros_like(N['u'])
+    # Strains and curvatures per unit sin / cos amplitude, coefficients of km^0, km^1, km^2
+    membrane = [np.stack(rows, axis=-2) for rows in ((N['du'], zero, N['dv']), (zero, -N['v'], N['u']))]
+    bending = [np.stack(rows, axis=-2) for rows in ((-N['ddw'], zero, zero), (zero, zero, -2 * N['dw']),
+                                                    (zero, N['w'], zero))]
+    plane = np.array([[1.0, v, 0.0], [v, 1.0, 0.0], [0.0, 0.0, (1 - v) / 2.0]]) * E / (1 - v ** 2)
+    D = t[:, np.newaxis, np.newaxis, np.newaxis] * plane
+    Db = t[:, np.newaxis, np.newaxis, np.newaxis] ** 3 / 12.0 * plane
+    k = np.zeros([len(t), 5, 8, 8])
+    for B, DB in ((membrane, D), (bending, Db)):
+        for p, Bp in enumerate(B):
+            for q, Bq in enumerate(B):
+                k[:, p + q] += _integrate(b, np.einsum('epri,eprs,epsj->epij', Bp, DB, Bq))
+    # Linear stress across the strip
+    xi = (1.0 + GAUSS_X) / 2.0
+    sig = stress[i, np.newaxis] * (1.0 - xi) + stress[j, np.newaxis] * xi
+    shapes = sum(np.einsum('epi,epj->epij', N[name], N[name]) for name in ('u', 'v', 'w'))
+    g = _integrate(b, (sig * t[:, np.newaxis])[:, :, np.newaxis, np.newaxis] * shapes)
+    T = _transform(dx / b, dy / b)
+    k = np.einsum('eki,epkl,elj->epij', T, k, T)
+    g = np.einsum('eki,ekl,elj->eij', T, g, T)
+    dofs = np.concatenate([NODE_DOFS * i[:, np.newaxis] + np.arange(NODE_DOFS),
+                           NODE_DOFS * j[:, np.newaxis] + np.arange(NODE_DOFS)], axis=1)
+    return k, g, dofs
+
+
+def _combine(k, g, length: float):
+    # Strip matrices of the half-wavelength from the blocks, ∫ sin² = ∫ cos² = a / 2 along the strip
+    km = np.pi / length
+    powers = km ** np.arange(5)
+    return length / 2.0 * np.tensordot(powers, k, axes=(0, 1)), length / 2.0 * km ** 2 * g
+
+
+def elementMatrices(nodes, elements, length: float, stress=None, E: float = E, v: float = v):
+    """
+    Elastic and geometric stiffness matrices of the strips in global coordinates, vectorized over the elements.
+    :param length: Half-wavelength.
+    :param stress: Reference stress of the nodes, compression positive. Column 7 of nodes if None.
+    :return: k, kg arrays with shape (elements, 8, 8), dofs global DOF numbers with shape (elements, 8).
+    """
+    k, g, dofs = elementBlocks(nodes, elements, stress, E, v)
+    return _combine(k, g, length) + (dofs,)
+
+
+def freeDofs(nodes, elements):
+    """Global DOFs with flag 1 in the nodes connected by elements."""
+    nodes, elements = np.asarray(nodes), np.asarray(elements)
+    used = np.zeros(len(nodes), dtype=bool)
+    used[elements[:, 1:3].astype(int).reshape(-1)] = True
+    flags = (nodes[:, 3:3 + NODE_DOFS] != 0) & used[:, np.newaxis]
+    return np.flatnonzero(flags.reshape(-1))
+
+
+def assemble(k, dofs, count: int, free=None):
+    """
+    Sparse global matrix of the element matrices.
+    :param count: Number of nodes.
+    :param free: Global DOFs kept in the matrix, all if None.
+    """
+    rows = np.broadcast_to(dofs[:, :, np.newaxis], k.shape).reshape(-1)
+    cols = np.broadcast_to(dofs[:, np.newaxis, :], k.shape).reshape(-1)
+    size = NODE_DOFS * count
+    K = sp.coo_matrix((k.reshape(-1), (rows, cols)), shape=(size, size)).tocsr()
+    return K if free is None else K[free][:, free]
+
+
+def solve(K, Kg, modes: int = 1, v0=None):
+    """
+    Smallest positive load factors of K φ = λ Kg φ. The problem is solved as Kg φ = (1 / λ) K φ for the largest
+    eigenvalues, K is positive definite and Kg may be indefinite (bending).
+    :param v0: Start vector of the eigensolver, e.g. a mode shape of a similar problem.
+    :return: Load factors (modes,) in ascending order, NaN if there are less buckling modes, and the mode shapes
+    with shape (DOFs, modes).
+    """
+    count = min(modes, K.shape[0] - 1)
+    mu, shapes = eigsh(Kg, k=count, M=K, which='LA', v0=v0)
+    order = np.argsort(mu)[::-1]
+    mu, shapes = mu[order], shapes[:, order]
+    lf = np.full(modes, np.nan)
+    with np.errstate(divide='ignore'):
+        lf[:count] = np.where(mu > 0.0, 1.0 / mu, np.nan)
+    return lf, shapes
+
+
+class StripModel:
+    """
+    Assembled length-independent matrices of one section, K and Kg of any half-wavelength are linear
+    combinations of them.
+    """
+
+    def __init__(self, nodes, elements, stress=None, E: float = E, v: float = v):
+        """
+        :param stress: Reference stress of the nodes, compression positive. Column 7 of nodes if None.
+        """
+        nodes = np.asarray(nodes, dtype=float)
+        stress = nodes[:, 7] if stress is None else np.asarray(stress, dtype=float)
+        if not np.any(stress):
+            raise ValueError('Reference stress is zero, set the stress column of nodes or give stress.')
+        k, g, dofs = elementBlocks(nodes, elements, stress, E, v)
+        self.free = freeDofs(nodes, elements)
+        self.blocks = [assemble(k[:, p], dofs, len(nodes), self.free) for p in range(k.shape[1])]
+        self.geometric = assemble(g, dofs, len(nodes), self.free)
+
+    def matrices(self, length: float):
+        """Elastic and geometric stiffness matrices K, Kg of the half-wavelength."""
+        km = np.pi / length
+        K = sum(km ** p * block for p, block in enumerate(self.blocks))
+        return length / 2.0 * K, length / 2.0 * km ** 2 * self.geometric
+
+    def solve(self, length: float, modes: int = 1, v0=None):
+        """Load factors and mode shapes of the half-wavelength, see solve."""
+        return solve(*self.matrices(length), modes, v0)
+
+
+def buckling(nodes, elements, lengths, stress=None, modes: int = 1, E: float = E, v: float = v,
+             warmStart: bool = True):
+    """
+    Load factors of the reference stress at the half-wavelengths.
+    :param lengths: Half-wavelengths, scalar or array.
+    :param stress: Reference stress of the nodes, compression positive. Column 7 of nodes if None.
+    :param modes: Number of buckling modes at every length.
+    :param warmStart: Start the eigensolver with the first mode shape of the previous length.
+    :return: Load factors with shape (lengths, modes), mode shapes with shape (lengths, DOFs, modes) and the
+    free global DOFs of the mode shape rows.
+    """
+    model = StripModel(nodes, elements, stress, E, v)
+    factors, shapes = [], []
+    v0 = None
+    for a in np.asarray(lengths, dtype=float).reshape(-1):
+        lf, phi = model.solve(a, modes, v0)
+        factors.append(lf)
+        shapes.append(phi)
+        v0 = phi[:, 0] if warmStart else None
+    return np.array(factors), np.array(shapes), model.free
+
+
+def stresses(nodes, elements, N: float = 0.0, Mx: float = 0.0, My: float = 0.0):
+    """
+    Node stresses of an axial force and bending moments about the centroidal axes, compression positive.
+    N > 0 is compression, Mx > 0 compresses the top (large y), My > 0 compresses large x.
+    The product moment of area is taken into account (unsymmetric sections, e.g. Z).
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    p = tw.sectionProps(nodes, elements)
+    x, y = nodes[:, 1] - p['zgx'], nodes[:, 2] - p['zgy']
+    det = p['Ix'] * p['Iy'] - p['Ixy'] ** 2
+    return (N / p['Ag'] + (Mx * p['Iy'] - My * p['Ixy']) / det * y
+            + (My * p['Ix'] - Mx * p['Ixy']) / det * x)
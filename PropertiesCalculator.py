@@ -1,47 +1,118 @@
 import math
-import matplotlib.pyplot as plt
 import numpy as np
-import EffectiveSection.EN1993_1_5.Sec4 as Sec4
-import EffectiveSection.EN1993_1_3.Sec5_5_3 as Sec553
-import EffectiveSection.Modes.IntCalcProp as intprop
+import BatchProperties as bprop
+import EffectiveSection.Modes.Pipeline as Pipeline
+
+
+# Load modes of the effective section, in the order of the report
+MODES = ('AxialCompression', 'BendingStrong', 'BendingWeakLip', 'BendingWeakWeb')
+# Calculation of the gross section properties, 'discretized' integrates the 47 node polyline (reference),
+# 'closedForm' integrates the straight parts and circular corners exactly
+GROSS_METHODS = ('discretized', 'closedForm')
+
+
+class LazyResult:
+    """
+    Attribute calculated on first access. The method producing the attribute is run once and
+    stores its results on the instance, later accesses read the stored value directly.
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.name = None
+
+    @classmethod
+    def group(cls, method, count: int):
+        """Separate attributes produced by the same method."""
+        return tuple(cls(method) for _ in range(count))
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        self.method(obj)
+        return obj.__dict__[self.name]
+
+
+def _geometry(sec):
+    sec.lippedCSection()
+
+
+def _gross(sec):
+    if sec.grossMethod == 'closedForm':
+        sec.closedFormProp()
+    else:
+        sec.grossProp(sec.x, sec.y, sec.t, sec.r)
+
+
+def _pipeline(sec):
+    sec.createPipeline()
+
+
+def _axial(sec):
+    sec.calcs_AxialCompression()
+
+
+def _strong(sec):
+    sec.calcs_BendingStrong()
+
+
+def _weakLip(sec):
+    sec.calcs_BendingWeakLip()
+
+
+def _weakWeb(sec):
+    sec.calcs_BendingWeakWeb()
 
 
 class SectionProp_C:
-    def __init__(self, a: float, b: float, c: float, t: float, ro: float, f: float):
-        self.elements = None
-        self.nodes = None
-        self.y_inches = None
-        self.x_inches = None
-        self.descp = None
-        self.tcore = None
-        self.cc = None
-        self.bb = None
-        self.aa = None
-        self.r = None
-        self.c = None
-        self.b = None
-        self.a = None
+    # Geometry, calculated by lippedCSection
+    nodes, elements, x, y, descp, x_inches, y_inches = LazyResult.group(_geometry, 7)
+    a, b, c, r, aa, bb, cc, tcore = LazyResult.group(_geometry, 8)
+    # Gross section properties, calculated by grossProp or closedFormProp
+    prop, Ar, zgx, zgy, Ix, Wx, Iy, Wy, Ixy, Iw, xsc, ysc, Cw, It, xo = LazyResult.group(_gross, 15)
+    # Effective section pipeline shared by the load modes
+    pipeline = LazyResult(_pipeline)
+    # Variables for axial compression
+    Axial_elementData2, Axial_Aeff, Axial_ygct, Axial_ygc, Axial_xgc, Axial_dxgc = LazyResult.group(_axial, 6)
+    # Variables for bending about strong axis
+    BendStrong_elementData2 = LazyResult(_strong)
+    BendStrong_ygct = LazyResult(_strong)  # Top flange extreme fiber to neutral axis
+    BendStrong_ygc = LazyResult(_strong)  # Bottom flange extreme fiber to neutral axis
+    BendStrong_Ixeff = LazyResult(_strong)  # Moment of inertia
+    BendStrong_Wxeff = LazyResult(_strong)  # Section modulus
+    # Variables for bending about weak axis, lips are under compression
+    BendWeakLip_elementData2, BendWeakLip_xgct, BendWeakLip_xgc = LazyResult.group(_weakLip, 3)
+    BendWeakLip_Iyeff = LazyResult(_weakLip)  # Moment of inertia
+    BendWeakLip_Wyeff = LazyResult(_weakLip)  # Section modulus
+    # Variables for bending about weak axis, web is under compression
+    BendWeakWeb_elementData2, BendWeakWeb_xgct, BendWeakWeb_xgc = LazyResult.group(_weakWeb, 3)
+    BendWeakWeb_Iyeff = LazyResult(_weakWeb)  # Moment of inertia
+    BendWeakWeb_Wyeff = LazyResult(_weakWeb)  # Section modulus
+
+    def __init__(self, a: float, b: float, c: float, t: float, ro: float, f: float, modes=(),
+                 grossMethod: str = 'discretized', chordTol: float = None):
+        """
+        Geometry, gross and effective section properties are calculated on first access.
+        :param modes: Load modes calculated in the constructor, any of MODES. Others are calculated on demand.
+        :param grossMethod: Calculation of the gross section properties, one of GROSS_METHODS.
+        :param chordTol: Largest distance between the corner arcs and their chords (mm). None gives 10° chords.
+        """
+        if grossMethod not in GROSS_METHODS:
+            raise ValueError(f'Unknown gross method {grossMethod}, use one of {GROSS_METHODS}.')
+        self.grossMethod = grossMethod
+        self.chordTol = chordTol
         self.R = ro
         self.t = t
         self.C = c
         self.B = b
         self.A = a
-        self.xo = None
-        self.It = None
-        self.Cw = None
-        self.ysc = None
-        self.xsc = None
-        self.Iw = None
-        self.Ixy = None
-        self.Wy = None
-        self.Iy = None
-        self.Wx = None
-        self.Ix = None
-        self.zgy = None
-        self.zgx = None
-        self.Ar = None
         self.E = 210000.0  # MPa
         self.v = 0.3  # Poisson's ratio
+        # Design stress
+        self.scomed = f
         # Reports
         self.Report = None
         self.ReportfPlot = f''
@@ -71,46 +142,28 @@ class SectionProp_C:
         Rep += f'R = {self.R:.2f} mm, Inner radius.\n'
         Rep += f'fy = {f:.2f} MPa, Steel yield stress.\n'
         self.Report = Rep
-        self.lippedCSection()
-        self.grossProp(self.x, self.y, self.t, self.r)
-        # Data for plotting
-        self.plot_C_section()
 
-        # Variables for axial compression
-        self.scomed = f
-        self.Axial_elementData2 = None
-        self.Axial_Aeff = None
-        self.Axial_ygct = None
-        self.Axial_ygc = None
-        self.Axial_xgc = None
-        self.Axial_dxgc = None
-        self.calcs_AxialCompression()
-        # Variables for bending about strong axis
-        self.BendStrong_elementData2 = None
-        self.BendStrong_ygct = None  # Top flange extreme fiber to neutral axis
-        self.BendStrong_ygc = None  # Bottom flange extreme fiber to neutral axis
-        self.BendStrong_Ixeff = None  # Moment of inertia
-        self.BendStrong_Wxeff = None  # Section modulus
-        self.calcs_BendingStrong()
-        # Variables for bending about strong axis
-        self.BendWeakLip_xgct = None
-        self.BendWeakLip_xgc = None
-        self.BendWeakLip_elementData2 = None
-        self.BendWeakLip_ygct = None  # Top flange extreme fiber to neutral axis
-        self.BendWeakLip_ygc = None  # Bottom flange extreme fiber to neutral axis
-        self.BendWeakLip_Iyeff = None  # Moment of inertia
-        self.BendWeakLip_Wyeff = None  # Section modulus
-        self.calcs_BendingWeakLip()
-        # Variables for bending about strong axis
-        self.BendWeakWeb_xgct = None
-        self.BendWeakWeb_xgc = None
-        self.BendWeakWeb_elementData2 = None
-        self.BendWeakWeb_ygct = None  # Top flange extreme fiber to neutral axis
-        self.BendWeakWeb_ygc = None  # Bottom flange extreme fiber to neutral axis
-        self.BendWeakWeb_Iyeff = None  # Moment of inertia
-        self.BendWeakWeb_Wyeff = None  # Section modulus
-        self.calcs_BendingWeakWeb()
-        self.plot_effC_section()
+        for mode in modes:
+            if mode not in MODES:
+                raise ValueError(f'Unknown load mode {mode}, use one of {MODES}.')
+        if modes:
+            # The gross section is reported before the effective section
+            self.calcGross()
+        for mode in MODES:
+            if mode in modes:
+                self.calcMode(mode)
+
+    def calcGross(self):
+        """Gross section properties, calculated once."""
+        return self.prop
+
+    def calcMode(self, mode: str):
+        """Effective section of the load mode, calculated once. Returns the effective element matrix."""
+        attr = {'AxialCompression': 'Axial_elementData2',
+                'BendingStrong': 'BendStrong_elementData2',
+                'BendingWeakLip': 'BendWeakLip_elementData2',
+                'BendingWeakWeb': 'BendWeakWeb_elementData2'}
+        return getattr(self, attr[mode])
 
     # ==================================================================================================================
     # CALCULATING THE INTERNAL COORDINATES
@@ -136,121 +189,29 @@ class SectionProp_C:
         self.cc = cc
         self.tcore = tcore
 
-        def tranform(alfa, origin):
-            # Transformation matrix
-            p = origin
-            c, s = np.cos(math.radians(alfa)), np.sin(math.radians(alfa))
-            j = np.array([[c, s, 0],
-                          [-s, c, 0],
-                          [0, 0, 1]])
-            RotatedCorners = np.matmul(j, p)
-            return RotatedCorners.T
-
-        # Bottom right
-        origin1 = np.array([bb - r, r, 0.0])
-        radius = np.array([0, r, 0.0])
-        start_ang = 90
-        p11 = tranform(start_ang + 10, radius)
-        p12 = tranform(start_ang + 20, radius)
-        p13 = tranform(start_ang + 30, radius)
-        p14 = tranform(start_ang + 40, radius)
-        p15 = tranform(start_ang + 50, radius)
-        p16 = tranform(start_ang + 60, radius)
-        p17 = tranform(start_ang + 70, radius)
-        p18 = tranform(start_ang + 80, radius)
-        # Bottom left
-        origin2 = np.array([r, r, 0.0])
-        start_ang = 180
-        p21 = tranform(start_ang + 10, radius)
-        p22 = tranform(start_ang + 20, radius)
-        p23 = tranform(start_ang + 30, radius)
-        p24 = tranform(start_ang + 40, radius)
-        p25 = tranform(start_ang + 50, radius)
-        p26 = tranform(start_ang + 60, radius)
-        p27 = tranform(start_ang + 70, radius)
-        p28 = tranform(start_ang + 80, radius)
-        # Top left
-        origin3 = np.array([r, aa - r, 0.0])
-        start_ang = 270
-        p31 = tranform(start_ang + 10, radius)
-        p32 = tranform(start_ang + 20, radius)
-        p33 = tranform(start_ang + 30, radius)
-        p34 = tranform(start_ang + 40, radius)
-        p35 = tranform(start_ang + 50, radius)
-        p36 = tranform(start_ang + 60, radius)
-        p37 = tranform(start_ang + 70, radius)
-        p38 = tranform(start_ang + 80, radius)
-        # Top right
-        origin4 = np.array([bb - r, aa - r, 0.0])
-        start_ang = 0
-        p41 = tranform(start_ang + 10, radius)
-        p42 = tranform(start_ang + 20, radius)
-        p43 = tranform(start_ang + 30, radius)
-        p44 = tranform(start_ang + 40, radius)
-        p45 = tranform(start_ang + 50, radius)
-        p46 = tranform(start_ang + 60, radius)
-        p47 = tranform(start_ang + 70, radius)
-        p48 = tranform(start_ang + 80, radius)
-
-        self.nodes = np.array([[0, bb, cc, 1, 1, 1, 1, 0],
-                               [1, bb, r, 1, 1, 1, 1, 0],
-                               [2, origin1[0] + p11[0], origin1[1] + p11[1], 1, 1, 1, 1, 0],
-                               [3, origin1[0] + p12[0], origin1[1] + p12[1], 1, 1, 1, 1, 0],
-                               [4, origin1[0] + p13[0], origin1[1] + p13[1], 1, 1, 1, 1, 0],
-                               [5, origin1[0] + p14[0], origin1[1] + p14[1], 1, 1, 1, 1, 0],
-                               [6, origin1[0] + p15[0], origin1[1] + p15[1], 1, 1, 1, 1, 0],
-                               [7, origin1[0] + p16[0], origin1[1] + p16[1], 1, 1, 1, 1, 0],
-                               [8, origin1[0] + p17[0], origin1[1] + p17[1], 1, 1, 1, 1, 0],
-                               [9, origin1[0] + p18[0], origin1[1] + p18[1], 1, 1, 1, 1, 0],
-                               [10, bb - r, 0, 1, 1, 1, 1, 0],
-                               [11, r + b / 2.0, 0, 1, 1, 1, 1, 0],
-                               [12, r, 0, 1, 1, 1, 1, 0],
-                               [13, origin2[0] + p21[0], origin2[1] + p21[1], 1, 1, 1, 1, 0],
-                               [14, origin2[0] + p22[0], origin2[1] + p22[1], 1, 1, 1, 1, 0],
-                               [15, origin2[0] + p23[0], origin2[1] + p23[1], 1, 1, 1, 1, 0],
-                               [16, origin2[0] + p24[0], origin2[1] + p24[1], 1, 1, 1, 1, 0],
-                               [17, origin2[0] + p25[0], origin2[1] + p25[1], 1, 1, 1, 1, 0],
-                               [18, origin2[0] + p26[0], origin2[1] + p26[1], 1, 1, 1, 1, 0],
-                               [19, origin2[0] + p27[0], origin2[1] + p27[1], 1, 1, 1, 1, 0],
-                               [20, origin2[0] + p28[0], origin2[1] + p28[1], 1, 1, 1, 1, 0],
-                               [21, 0, r, 1, 1, 1, 1, 0],
-                               [22, 0, r + a * (1.0 / 4.0), 1, 1, 1, 1, 0],
-                               [23, 0, r + a * (2.0 / 4.0), 1, 1, 1, 1, 0],
-                               [24, 0, r + a * (3.0 / 4.0), 1, 1, 1, 1, 0],
-                               [25, 0, r + a, 1, 1, 1, 1, 0],
-                               [26, origin3[0] + p31[0], origin3[1] + p31[1], 1, 1, 1, 1, 0],
-                               [27, origin3[0] + p32[0], origin3[1] + p32[1], 1, 1, 1, 1, 0],
-                               [28, origin3[0] + p33[0], origin3[1] + p33[1], 1, 1, 1, 1, 0],
-                               [29, origin3[0] + p34[0], origin3[1] + p34[1], 1, 1, 1, 1, 0],
-                               [30, origin3[0] + p35[0], origin3[1] + p35[1], 1, 1, 1, 1, 0],
-                               [31, origin3[0] + p36[0], origin3[1] + p36[1], 1, 1, 1, 1, 0],
-                               [32, origin3[0] + p37[0], origin3[1] + p37[1], 1, 1, 1, 1, 0],
-                               [33, origin3[0] + p38[0], origin3[1] + p38[1], 1, 1, 1, 1, 0],
-                               [34, r, aa, 1, 1, 1, 1, 0],
-                               [35, r + b / 2.0, aa, 1, 1, 1, 1, 0],
-                               [36, bb - r, aa, 1, 1, 1, 1, 0],
-                               [37, origin4[0] + p41[0], origin4[1] + p41[1], 1, 1, 1, 1, 0],
-                               [38, origin4[0] + p42[0], origin4[1] + p42[1], 1, 1, 1, 1, 0],
-                               [39, origin4[0] + p43[0], origin4[1] + p43[1], 1, 1, 1, 1, 0],
-                               [40, origin4[0] + p44[0], origin4[1] + p44[1], 1, 1, 1, 1, 0],
-                               [41, origin4[0] + p45[0], origin4[1] + p45[1], 1, 1, 1, 1, 0],
-                               [42, origin4[0] + p46[0], origin4[1] + p46[1], 1, 1, 1, 1, 0],
-                               [43, origin4[0] + p47[0], origin4[1] + p47[1], 1, 1, 1, 1, 0],
-                               [44, origin4[0] + p48[0], origin4[1] + p48[1], 1, 1, 1, 1, 0],
-                               [45, bb, aa - r, 1, 1, 1, 1, 0],
-                               [46, bb, aa - cc, 1, 1, 1, 1, 0]])
-
-        self.elements = np.array([[0, 0, 1, self.t, 0],
-                                  [1, 1, 2, self.t, 0],
-                                  [2, 2, 3, self.t, 0],
-                                  [3, 3, 4, self.t, 0],
-                                  [4, 4, 5, self.t, 0],
-                                  [5, 5, 6, self.t, 0],
-                                  [6, 6, 7, self.t, 0],
-                                  [7, 7, 8, self.t, 0],
-                                  [8, 8, 9, self.t, 0],
-                                  [9, 9, 10, self.t, 0]
-                                  ])
+        # Corner nodes, one sin/cos array per corner
+        basis = bprop.cornerBasis(bprop.cornerChords(r, self.chordTol))
+
+        def corner(cx, cy, start_ang):
+            sin, cos = basis[start_ang]
+            return np.column_stack([cx + r * sin, cy + r * cos])
+
+        points = [[[bb, cc], [bb, r]],
+                  corner(bb - r, r, 90),  # Bottom right
+                  [[bb - r, 0], [r + b / 2.0, 0], [r, 0]],
+                  corner(r, r, 180),  # Bottom left
+                  [[0, r], [0, r + a * (1.0 / 4.0)], [0, r + a * (2.0 / 4.0)], [0, r + a * (3.0 / 4.0)], [0, r + a]],
+                  corner(r, aa - r, 270),  # Top left
+                  [[r, aa], [r + b / 2.0, aa], [bb - r, aa]],
+                  corner(bb - r, aa - r, 0),  # Top right
+                  [[bb, aa - r], [bb, aa - cc]]]
+        xy = np.concatenate([np.asarray(i, dtype=float) for i in points])
+        # 0 id, 1 x, 2 y, 3-7 flags
+        self.nodes = np.column_stack([np.arange(len(xy)), xy, np.tile([1, 1, 1, 1, 0], (len(xy), 1))])
+
+        # 0 id, 1 node i, 2 node j, 3 t, 4 material, one element between each pair of consecutive nodes
+        ids = np.arange(len(xy) - 1)
+        self.elements = np.column_stack([ids, ids, ids + 1, np.full(len(ids), self.t), np.zeros(len(ids))])
         self.x = self.nodes[:, 1]
         self.y = self.nodes[:, 2]
         self.descp = f'Section : A: {self.A:.2f}, B: {self.B:.2f}, C: {self.C:.2f}, t: {self.t:.2f}'
@@ -364,160 +325,97 @@ class SectionProp_C:
         propData[13] = xo
         Wx = Ix * (1 - 2 * delta) / max(zgb, zgt)
         Wy = Iy * (1 - 2 * delta) / max(zgl, zgr)
+        self.setGrossProp({'Ag': Ar, 'zgx': zgx, 'zgy': zgy, 'Ix': Ix, 'Wx': Wx, 'Iy': Iy, 'Wy': Wy, 'Ixy': Ixy,
+                           'Iw': Iw, 'xsc': xsc, 'ysc': ysc, 'Cw': Cw, 'It': It, 'xo': xo})
+
+        return self.prop, propData
+
+    def closedFormProp(self):
+        """Gross section properties with the closed-form integrals of BatchProperties.grossPropsClosed."""
+        values = bprop.grossPropsClosed(self.A, self.B, self.C, self.t, self.R)
+        self.setGrossProp({key: float(value) for key, value in values.items()})
+        return self.prop
+
+    def setGrossProp(self, values):
+        """
+        Defines the gross section attributes, the property dictionary and the report.
+        :param values: dict of the values, keys as in BatchProperties.grossProps.
+        """
         # Define the attributes
-        self.Ar = Ar
-        self.zgx = zgx
-        self.zgy = zgy
-        self.Ix = Ix
-        self.Wx = Wx
-        self.Iy = Iy
-        self.Wy = Wy
-        self.Ixy = Ixy
-        self.Iw = Iw
-        self.xsc = xsc
-        self.ysc = ysc
-        self.Cw = Cw
-        self.It = It
-        self.xo = xo
+        self.Ar = values['Ag']
+        self.zgx = values['zgx']
+        self.zgy = values['zgy']
+        self.Ix = values['Ix']
+        self.Wx = values['Wx']
+        self.Iy = values['Iy']
+        self.Wy = values['Wy']
+        self.Ixy = values['Ixy']
+        self.Iw = values['Iw']
+        self.xsc = values['xsc']
+        self.ysc = values['ysc']
+        self.Cw = values['Cw']
+        self.It = values['It']
+        self.xo = values['xo']
 
         # Data dictionary
         self.prop = {
-            "Ag": [Ar, ' mm2', ', Area of cross-section'],
-            "zgx": [zgx, ' mm', ', Coordinate for gravity centre'],
-            "zgy": [zgy, ' mm', ', Coordinate for gravity centre'],
-            "Ix": [Ix, ' mm4', ', Second moment of area about strong axis'],
-            "Wx": [Ix * (1 - 2 * delta) / max(zgb, zgt), ' mm3', ', Section modulus about strong axis'],
-            "Iy": [Iy, ' mm4', ', Second moment of area about weak axis'],
-            "Wy": [Iy * (1 - 2 * delta) / max(zgl, zgr), ' mm3', ', Section modulus about weak axis'],
-            "Ixy": [Ixy, ' mm4', ', Product moment of area'],
-            "Iw": [np.sum(Iw), ' ', ' Sectorial constant'],
-            "xsc": [xsc, ' mm', ', Shear center on y axis'],
-            "ysc": [ysc, ' mm', ', Shear center on x axis'],
-            "Cw": [Cw, ' mm6', ', Warping constant'],
-            "It": [It, ' mm4', ', Torsional constant'],
-            "xo": [xo, ' mm', ', Distance between centroid and shear centre']
+            "Ag": [self.Ar, ' mm2', ', Area of cross-section'],
+            "zgx": [self.zgx, ' mm', ', Coordinate for gravity centre'],
+            "zgy": [self.zgy, ' mm', ', Coordinate for gravity centre'],
+            "Ix": [self.Ix, ' mm4', ', Second moment of area about strong axis'],
+            "Wx": [self.Wx, ' mm3', ', Section modulus about strong axis'],
+            "Iy": [self.Iy, ' mm4', ', Second moment of area about weak axis'],
+            "Wy": [self.Wy, ' mm3', ', Section modulus about weak axis'],
+            "Ixy": [self.Ixy, ' mm4', ', Product moment of area'],
+            "Iw": [np.sum(self.Iw), ' ', ' Sectorial constant'],
+            "xsc": [self.xsc, ' mm', ', Shear center on y axis'],
+            "ysc": [self.ysc, ' mm', ', Shear center on x axis'],
+            "Cw": [self.Cw, ' mm6', ', Warping constant'],
+            "It": [self.It, ' mm4', ', Torsional constant'],
+            "xo": [self.xo, ' mm', ', Distance between centroid and shear centre']
         }
-        # print(self.prop)
         self.Report += f'{self.secDivider}\nGROSS SECTION PROPERTIES (in mm)\n{self.secDivider}\n'
         for key, value in self.prop.items():
             self.Report += f'{self.space3}{key}: {value[0]:.4f}{value[1]}{value[2]}\n'
             self.ReportfPlot += f'{key}: {value[0]:.2f}{value[1]}\n'
 
-        return self.prop, propData
-
     # ==================================================================================================================
     # EFFECTIVE SECTION FUNCTIONS
     # ==================================================================================================================
+    def pipelineGeometry(self, n: int = 1):
+        """Centreline dimensions and gross centre of gravity of the section, repeated n times for the pipeline."""
+        return {key: np.full(n, float(np.squeeze(getattr(self, key)))) for key in ('aa', 'bb', 'cc', 'tcore', 'zgx')}
+
+    def createPipeline(self):
+        """Effective section pipeline of the section, the intermediates are shared by the load modes."""
+        self.pipeline = Pipeline.EffectivePipeline(self.pipelineGeometry(), self.scomed, self.E, self.v)
+
+    def stressSweep(self, stresses, modes=MODES):
+        """
+        Effective section properties at several stress levels, e.g. for interaction diagrams or at the
+        serviceability stress level. Geometry and gross properties are calculated once for all stresses.
+        :param stresses: Design stresses σcom,Ed (MPa).
+        :param modes: Load modes, any of MODES.
+        :return: dict of the modes, each a dict of arrays with one value per stress, see Pipeline.EffectivePipeline.run.
+        """
+        for mode in modes:
+            if mode not in MODES:
+                raise ValueError(f'Unknown load mode {mode}, use one of {MODES}.')
+        stresses = np.asarray(stresses, dtype=float).reshape(-1)
+        pipe = Pipeline.EffectivePipeline(self.pipelineGeometry(len(stresses)), stresses, self.E, self.v)
+        return {mode: pipe.run(mode) for mode in modes}
+
     def calcs_AxialCompression(self):
-        # Design Stress
-        scomed = self.scomed
-        # ==============================================================================================================
-        # Effective width of the top flange
-        # ==============================================================================================================
-        top_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        top_flg_ksigma = Sec4.Table4_1_ksigma(top_flg_stress_ratio)
-        top_flg_lamp = Sec4.lamp(self.bb, self.tcore, top_flg_ksigma, scomed, True)
-        top_flg_rho = Sec4.internal_element(top_flg_lamp, top_flg_stress_ratio)
-        top_flg_beff = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[0]
-        top_flg_be1 = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[1]
-        top_flg_be2 = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[2]
-        # ==============================================================================================================
-        # Effective width of the bot flange
-        # ==============================================================================================================
-        bot_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        bot_flg_ksigma = Sec4.Table4_1_ksigma(bot_flg_stress_ratio)
-        bot_flg_lamp = Sec4.lamp(self.bb, self.tcore, bot_flg_ksigma, scomed, True)
-        bot_flg_rho = Sec4.internal_element(bot_flg_lamp, bot_flg_stress_ratio)
-        bot_flg_beff = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[0]
-        bot_flg_be1 = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[1]
-        bot_flg_be2 = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[2]
-        # ==============================================================================================================
-        # Effective width of the top edge fold
-        # ==============================================================================================================
-        top_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        top_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        top_lip_lamp = Sec4.lamp(self.cc, self.tcore, top_lip_ksigma, scomed, True)
-        top_lip_rho = Sec4.outstand_element(top_lip_lamp)
-        top_lip_beff = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[0]
-        top_lip_bc = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[1]
-        top_lip_bt = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        top_As = self.tcore * (top_flg_be2 + top_lip_beff)
-        # Spring stiffness of the edge stiffener
-        top_b1 = Sec553.calc_b1(self.bb, top_flg_be2, self.tcore, top_lip_beff)
-        top_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, top_b1, self.aa,
-                                        top_b1, False)
-        top_Is = Sec553.Is(top_flg_be2, self.tcore, top_lip_beff)
-        top_scrs = Sec553.calc_scrs(top_K, top_Is, self.E, top_As)
-        # Thickness reduction factor
-        top_xd = Sec553.thk_reduction(scomed, top_scrs)
-        top_t_red = top_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the bottom edge fold
-        # ==============================================================================================================
-        bot_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        bot_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        bot_lip_lamp = Sec4.lamp(self.cc, self.tcore, bot_lip_ksigma, scomed, True)
-        bot_lip_rho = Sec4.outstand_element(bot_lip_lamp)
-        bot_lip_beff = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[0]
-        bot_lip_bc = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[1]
-        bot_lip_bt = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        bot_As = self.tcore * (bot_flg_be2 + bot_lip_beff)
-        # Spring stiffness of the edge stiffener
-        bot_b1 = Sec553.calc_b1(self.bb, bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, bot_b1, self.aa,
-                                        bot_b1, False)
-        bot_Is = Sec553.Is(bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_scrs = Sec553.calc_scrs(bot_K, bot_Is, self.E, bot_As)
-        # Thickness reduction factor
-        bot_xd = Sec553.thk_reduction(scomed, bot_scrs)
-        bot_t_red = bot_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the web
-        # ==============================================================================================================
-        elementData1 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
-        # Distance from tension (bottom) flange
-        ht = intprop.calcProps(elementData1)[1]
-        # Distance from compression (top) flange
-        hc = self.aa - ht
-        # Stress ratio
-        ff = 1.0  # uniform compression
-        web_ksigma = Sec4.Table4_1_ksigma(ff)
-        web_lamp = Sec4.lamp(self.aa, self.tcore, web_ksigma, scomed, True)
-        web_rho = Sec4.internal_element(web_lamp, ff)
-        web_beff = Sec4.Table4_1_beff(ff, self.aa, web_rho)[0]
-        web_be1 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[1]
-        web_be2 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[2]
-        h1 = web_be1
-        h2 = web_be2
-        # ==============================================================================================================
-        # Effective section properties
-        # ==============================================================================================================
-        # Create a matrix contains the element data from bottom lip to top lip
-        # 0 id , 1 inodeX, 2 inodeY, 3 jnodeX, 4 JnodeY, 5 thickness
-        self.Axial_elementData2 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [4, 0.0, 0.0, 0.0, h2, self.tcore],
-             [5, 0.0, self.aa - h1, 0.0, self.aa, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
+        # Uniform compression on flanges, lips and web
+        res = self.pipeline.run('AxialCompression')
+        self.Axial_elementData2 = res['elementData2'][0]
 
         # Results
-        self.Axial_ygc = intprop.calcProps(self.Axial_elementData2)[1]
-        self.Axial_ygct = self.aa - intprop.calcProps(self.Axial_elementData2)[1]
-        self.Axial_xgc = intprop.calcProps(self.Axial_elementData2)[3]
-        self.Axial_Aeff = intprop.calcProps(self.Axial_elementData2)[0]
-        self.Axial_dxgc = self.Axial_xgc - self.zgx  # if it is + compression on web.
+        self.Axial_ygc = res['ygc'][0]
+        self.Axial_ygct = res['ygct'][0]
+        self.Axial_xgc = res['xgc'][0]
+        self.Axial_Aeff = res['Aeff'][0]
+        self.Axial_dxgc = res['dxgc'][0]  # if it is + compression on web.
         self.Report += (f'{self.secDivider}\nEFFECTIVE SECTION PROPERTIES (in mm)\n{self.secDivider}\n'
                         f'==== Axial Compression ====\n'
                         f'{self.space3}σComEd : {self.scomed:.2f} MPa, Stress level\n'
@@ -525,115 +423,15 @@ class SectionProp_C:
                         f'{self.space3}Δxgc : {self.Axial_dxgc:.3f} mm, drift on centre of gravity\n')
 
     def calcs_BendingStrong(self):
-        # Design Stress
-        scomed = self.scomed
-        # ==============================================================================================================
-        # Effective width of the top flange
-        # ==============================================================================================================
-        top_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        top_flg_ksigma = Sec4.Table4_1_ksigma(top_flg_stress_ratio)
-        top_flg_lamp = Sec4.lamp(self.bb, self.tcore, top_flg_ksigma, scomed, True)
-        top_flg_rho = Sec4.internal_element(top_flg_lamp, top_flg_stress_ratio)
-        top_flg_beff = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[0]
-        top_flg_be1 = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[1]
-        top_flg_be2 = Sec4.Table4_1_beff(top_flg_stress_ratio, self.bb, top_flg_rho)[2]
-        # ==============================================================================================================
-        # Effective width of the bot flange
-        # ==============================================================================================================
-        bot_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        bot_flg_ksigma = Sec4.Table4_1_ksigma(bot_flg_stress_ratio)
-        bot_flg_lamp = Sec4.lamp(self.bb, self.tcore, bot_flg_ksigma, scomed, False)
-        bot_flg_rho = Sec4.internal_element(bot_flg_lamp, bot_flg_stress_ratio)
-        bot_flg_beff = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[0]
-        bot_flg_be1 = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[1]
-        bot_flg_be2 = Sec4.Table4_1_beff(bot_flg_stress_ratio, self.bb, bot_flg_rho)[2]
-        # ==============================================================================================================
-        # Effective width of the top edge fold
-        # ==============================================================================================================
-        top_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        top_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        top_lip_lamp = Sec4.lamp(self.cc, self.tcore, top_lip_ksigma, scomed, True)
-        top_lip_rho = Sec4.outstand_element(top_lip_lamp)
-        top_lip_beff = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[0]
-        top_lip_bc = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[1]
-        top_lip_bt = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        top_As = self.tcore * (top_flg_be2 + top_lip_beff)
-        # Spring stiffness of the edge stiffener
-        top_b1 = Sec553.calc_b1(self.bb, top_flg_be2, self.tcore, top_lip_beff)
-        top_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, top_b1, self.aa,
-                                        top_b1, True)
-        top_Is = Sec553.Is(top_flg_be2, self.tcore, top_lip_beff)
-        top_scrs = Sec553.calc_scrs(top_K, top_Is, self.E, top_As)
-        # Thickness reduction factor
-        top_xd = Sec553.thk_reduction(scomed, top_scrs)
-        top_t_red = top_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the bottom edge fold
-        # ==============================================================================================================
-        bot_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        bot_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        bot_lip_lamp = Sec4.lamp(self.cc, self.tcore, bot_lip_ksigma, scomed, False)
-        bot_lip_rho = Sec4.outstand_element(bot_lip_lamp)
-        bot_lip_beff = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[0]
-        bot_lip_bc = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[1]
-        bot_lip_bt = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        bot_As = self.tcore * (bot_flg_be2 + bot_lip_beff)
-        # Spring stiffness of the edge stiffener
-        bot_b1 = Sec553.calc_b1(self.bb, bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, bot_b1, self.aa,
-                                        bot_b1, True)
-        bot_Is = Sec553.Is(bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_scrs = Sec553.calc_scrs(bot_K, bot_Is, self.E, bot_As)
-        # Thickness reduction factor
-        bot_xd = 1.0  # Tension on bottom flange
-        bot_t_red = bot_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the web
-        # ==============================================================================================================
-        elementData1 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
-        # Distance from tension (bottom) flange
-        ht = intprop.calcProps(elementData1)[1]
-        # Distance from compression (top) flange
-        hc = self.aa - ht
-        # Stress ratio
-        ff = (hc - self.aa) / hc
-        web_ksigma = Sec4.Table4_1_ksigma(ff)
-        web_lamp = Sec4.lamp(self.aa, self.tcore, web_ksigma, scomed, True)
-        web_rho = Sec4.internal_element(web_lamp, ff)
-        web_beff = Sec4.Table4_1_beff(ff, self.aa, web_rho)[0]
-        web_be1 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[1]
-        web_be2 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[2]
-        h1 = web_be1
-        h2 = self.aa - (hc - web_be2)
-        # ==============================================================================================================
-        # Effective section properties
-        # ==============================================================================================================
-        # Create a matrix contains the element data from bottom lip to top lip
-        # 0 id , 1 inodeX, 2 inodeY, 3 jnodeX, 4 JnodeY, 5 thickness
-        self.BendStrong_elementData2 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [4, 0.0, 0.0, 0.0, h2, self.tcore],
-             [5, 0.0, self.aa - h1, 0.0, self.aa, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
+        # Compression on top flange and lip, tension on bottom flange and lip, web from the neutral axis
+        res = self.pipeline.run('BendingStrong')
+        self.BendStrong_elementData2 = res['elementData2'][0]
 
         # Results
-        self.BendStrong_Ixeff = intprop.calcProps(self.BendStrong_elementData2)[2]
-        self.BendStrong_ygc = intprop.calcProps(self.BendStrong_elementData2)[1]
-        self.BendStrong_ygct = self.aa - intprop.calcProps(self.BendStrong_elementData2)[1]
-        self.BendStrong_Wxeff = intprop.calcProps(self.BendStrong_elementData2)[2] / (
-                self.aa - intprop.calcProps(self.BendStrong_elementData2)[1])
+        self.BendStrong_Ixeff = res['Ixeff'][0]
+        self.BendStrong_ygc = res['ygc'][0]
+        self.BendStrong_ygct = res['ygct'][0]
+        self.BendStrong_Wxeff = res['Wxeff'][0]
 
         self.Report += (f'==== Bending About Strong Axis ====\n'
                         f'{self.space3}σComEd : {self.scomed:.2f} MPa, Stress level\n'
@@ -641,104 +439,15 @@ class SectionProp_C:
                         f'{self.space3}Wxeff : {self.BendStrong_Wxeff :.3f} mm³, Effective section modulus\n')
 
     def calcs_BendingWeakLip(self):
-        # Design Stress
-        scomed = self.scomed
-        # ==============================================================================================================
-        # Effective width of the top flange
-        # ==============================================================================================================
-        top_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        top_flg_ksigma = Sec4.Table4_2_ksigma(top_flg_stress_ratio, True)
-        top_flg_lamp = Sec4.lamp(self.bb, self.tcore, top_flg_ksigma, scomed, True)
-        top_flg_rho = Sec4.internal_element(top_flg_lamp, top_flg_stress_ratio)
-        top_flg_beff = Sec4.Table4_2_beff(self.bb, top_flg_rho, top_flg_stress_ratio)[0]
-        top_flg_be1 = self.zgx
-        top_flg_be2 = top_flg_beff
-        # ==============================================================================================================
-        # Effective width of the bot flange
-        # ==============================================================================================================
-        bot_flg_stress_ratio = Sec4.stres_ratio(self.bb, 0.0)  # bwhole is 0 for uniform stress.
-        bot_flg_ksigma = Sec4.Table4_2_ksigma(bot_flg_stress_ratio, True)
-        bot_flg_lamp = Sec4.lamp(self.bb, self.tcore, bot_flg_ksigma, scomed, True)
-        bot_flg_rho = Sec4.internal_element(bot_flg_lamp, bot_flg_stress_ratio)
-        bot_flg_beff = Sec4.Table4_2_beff(self.bb, bot_flg_rho, bot_flg_stress_ratio)[0]
-        bot_flg_be1 = self.zgx
-        bot_flg_be2 = bot_flg_beff
-        # ==============================================================================================================
-        # Effective width of the top edge fold
-        # ==============================================================================================================
-        top_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        top_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        top_lip_lamp = Sec4.lamp(self.cc, self.tcore, top_lip_ksigma, scomed, True)
-        top_lip_rho = Sec4.outstand_element(top_lip_lamp)
-        top_lip_beff = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[0]
-        top_lip_bc = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[1]
-        top_lip_bt = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        top_As = self.tcore * (top_flg_be2 + top_lip_beff)
-        # Spring stiffness of the edge stiffener
-        top_b1 = Sec553.calc_b1(self.bb, top_flg_be2, self.tcore, top_lip_beff)
-        top_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, top_b1, self.aa,
-                                        top_b1, False)
-        top_Is = Sec553.Is(top_flg_be2, self.tcore, top_lip_beff)
-        top_scrs = Sec553.calc_scrs(top_K, top_Is, self.E, top_As)
-        # Thickness reduction factor
-        top_xd = Sec553.thk_reduction(scomed, top_scrs)
-        top_t_red = top_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the bottom edge fold
-        # ==============================================================================================================
-        bot_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        bot_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        bot_lip_lamp = Sec4.lamp(self.cc, self.tcore, bot_lip_ksigma, scomed, True)
-        bot_lip_rho = Sec4.outstand_element(bot_lip_lamp)
-        bot_lip_beff = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[0]
-        bot_lip_bc = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[1]
-        bot_lip_bt = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        bot_As = self.tcore * (bot_flg_be2 + bot_lip_beff)
-        # Spring stiffness of the edge stiffener
-        bot_b1 = Sec553.calc_b1(self.bb, bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, bot_b1, self.aa,
-                                        bot_b1, False)
-        bot_Is = Sec553.Is(bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_scrs = Sec553.calc_scrs(bot_K, bot_Is, self.E, bot_As)
-        # Thickness reduction factor
-        bot_xd = Sec553.thk_reduction(scomed, bot_scrs)
-        bot_t_red = bot_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the web
-        # ==============================================================================================================
-        # Web is fully effective under tension
-        ff = 1.0
-        web_ksigma = Sec4.Table4_1_ksigma(ff)
-        web_lamp = Sec4.lamp(self.aa, self.tcore, web_ksigma, scomed, False)
-        web_rho = Sec4.internal_element(web_lamp, ff)
-        web_beff = Sec4.Table4_1_beff(ff, self.aa, web_rho)[0]
-        web_be1 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[1]
-        web_be2 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[2]
-        h1 = web_be1
-        h2 = web_be1
-        # ==============================================================================================================
-        # Effective section properties
-        # ==============================================================================================================
-        # Create a matrix contains the element data from bottom lip to top lip
-        # 0 id , 1 inodeX, 2 inodeY, 3 jnodeX, 4 JnodeY, 5 thickness
-        self.BendWeakLip_elementData2 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [4, 0.0, 0.0, 0.0, h2, self.tcore],
-             [5, 0.0, self.aa - h1, 0.0, self.aa, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
+        # Compression on lips, web is fully effective under tension
+        res = self.pipeline.run('BendingWeakLip')
+        self.BendWeakLip_elementData2 = res['elementData2'][0]
 
         # Results
-        self.BendWeakLip_Iyeff = intprop.calcProps(self.BendWeakLip_elementData2)[4]
-        self.BendWeakLip_xgc = intprop.calcProps(self.BendWeakLip_elementData2)[3]
-        self.BendWeakLip_xgct = self.bb - intprop.calcProps(self.BendWeakLip_elementData2)[3]
-        self.BendWeakLip_Wyeff = intprop.calcProps(self.BendWeakLip_elementData2)[4] / (
-            max(self.BendWeakLip_xgc, self.BendWeakLip_xgct))
+        self.BendWeakLip_Iyeff = res['Iyeff'][0]
+        self.BendWeakLip_xgc = res['xgc'][0]
+        self.BendWeakLip_xgct = res['xgct'][0]
+        self.BendWeakLip_Wyeff = res['Wyeff'][0]
 
         self.Report += (f'==== Bending About Weak Axis, Lips Are Under Compression ====\n'
                         f'{self.space3}σComEd : {self.scomed:.2f} MPa, Stress level\n'
@@ -746,111 +455,26 @@ class SectionProp_C:
                         f'{self.space3}Wyeff : {self.BendWeakLip_Wyeff :.3f} mm³, Effective section modulus\n')
 
     def calcs_BendingWeakWeb(self):
-        # Design Stress
-        scomed = self.scomed
-        # ==============================================================================================================
-        # Effective width of the top flange
-        # ==============================================================================================================
-        # Only tension part is taken into account for the flange (bb-zgx)
-        top_flg_be1 = 0.0
-        top_flg_be2 = (self.bb - self.zgx)
-        # ==============================================================================================================
-        # Effective width of the bot flange
-        # ==============================================================================================================
-        # Only tension part is taken into account for the flange (bb-zgx)
-        bot_flg_be1 = 0.0
-        bot_flg_be2 = (self.bb - self.zgx)
-        # ==============================================================================================================
-        # Effective width of the top edge fold
-        # ==============================================================================================================
-        # Lip is fully effective under tension.
-        top_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        top_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        top_lip_lamp = Sec4.lamp(self.cc, self.tcore, top_lip_ksigma, scomed, False)
-        top_lip_rho = Sec4.outstand_element(top_lip_lamp)
-        top_lip_beff = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[0]
-        top_lip_bc = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[1]
-        top_lip_bt = Sec4.Table4_2_beff(self.cc, top_lip_rho, top_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        top_As = self.tcore * (top_flg_be2 + top_lip_beff)
-        # Spring stiffness of the edge stiffener
-        top_b1 = Sec553.calc_b1(self.bb, top_flg_be2, self.tcore, top_lip_beff)
-        top_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, top_b1, self.aa,
-                                        top_b1, True)
-        top_Is = Sec553.Is(top_flg_be2, self.tcore, top_lip_beff)
-        top_scrs = Sec553.calc_scrs(top_K, top_Is, self.E, top_As)
-        # Thickness reduction factor
-        top_xd = Sec553.thk_reduction(scomed, top_scrs)
-        top_t_red = top_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the bottom edge fold
-        # ==============================================================================================================
-        # Lip is fully effective under tension.
-        bot_lip_stres_ratio = Sec4.stres_ratio(self.cc, 0.0)  # bwhole is 0 for uniform stress.
-        bot_lip_ksigma = Sec553.ksig(self.cc, self.bb)
-        bot_lip_lamp = Sec4.lamp(self.cc, self.tcore, bot_lip_ksigma, scomed, False)
-        bot_lip_rho = Sec4.outstand_element(bot_lip_lamp)
-        bot_lip_beff = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[0]
-        bot_lip_bc = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[1]
-        bot_lip_bt = Sec4.Table4_2_beff(self.cc, bot_lip_rho, bot_lip_stres_ratio)[2]
-        # Effective area of the edge stiffener
-        bot_As = self.tcore * (bot_flg_be2 + bot_lip_beff)
-        # Spring stiffness of the edge stiffener
-        bot_b1 = Sec553.calc_b1(self.bb, bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_K = Sec553.springStiffnessK(self.E, self.tcore, self.v, bot_b1, self.aa,
-                                        bot_b1, True)
-        bot_Is = Sec553.Is(bot_flg_be2, self.tcore, bot_lip_beff)
-        bot_scrs = Sec553.calc_scrs(bot_K, bot_Is, self.E, bot_As)
-        # Thickness reduction factor
-        bot_xd = 1.0  # Tension on bottom flange
-        bot_t_red = bot_xd * self.tcore
-        # ==============================================================================================================
-        # Effective width of the web
-        # ==============================================================================================================
-        # Stress ratio / Uniform compression on web
-        ff = 1.0
-        web_ksigma = Sec4.Table4_1_ksigma(ff)
-        web_lamp = Sec4.lamp(self.aa, self.tcore, web_ksigma, scomed, True)
-        web_rho = Sec4.internal_element(web_lamp, ff)
-        web_beff = Sec4.Table4_1_beff(ff, self.aa, web_rho)[0]
-        web_be1 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[1]
-        web_be2 = Sec4.Table4_1_beff(ff, self.aa, web_rho)[2]
-        h1 = web_be1
-        h2 = web_be1
-        # ==============================================================================================================
-        # Effective section properties
-        # ==============================================================================================================
-        # Create a matrix contains the element data from bottom lip to top lip
-        # 0 id , 1 inodeX, 2 inodeY, 3 jnodeX, 4 JnodeY, 5 thickness
-        self.BendWeakWeb_elementData2 = np.array(
-            [[1, self.bb, bot_lip_beff, self.bb, 0.0, bot_t_red],
-             [2, self.bb, 0.0, self.bb - bot_flg_be2, 0.0, bot_t_red],
-             [3, bot_flg_be1, 0.0, 0.0, 0.0, self.tcore],
-             [4, 0.0, 0.0, 0.0, h2, self.tcore],
-             [5, 0.0, self.aa - h1, 0.0, self.aa, self.tcore],
-             [6, 0.0, self.aa, top_flg_be1, self.aa, self.tcore],
-             [7, self.bb - top_flg_be2, self.aa, self.bb, self.aa, top_t_red],
-             [8, self.bb, self.aa, self.bb, self.aa - top_lip_beff, top_t_red]])
+        # Uniform compression on web, only tension part of the flanges (bb-zgx), lips are fully effective
+        res = self.pipeline.run('BendingWeakWeb')
+        self.BendWeakWeb_elementData2 = res['elementData2'][0]
 
         # Results
-        self.BendWeakWeb_Iyeff = intprop.calcProps(self.BendWeakWeb_elementData2)[4]
-        self.BendWeakWeb_xgc = intprop.calcProps(self.BendWeakWeb_elementData2)[3]
-        self.BendWeakWeb_xgct = self.bb - intprop.calcProps(self.BendWeakWeb_elementData2)[3]
-        self.BendWeakWeb_Wyeff = intprop.calcProps(self.BendWeakWeb_elementData2)[4] / (
-            max(self.BendWeakWeb_xgc, self.BendWeakWeb_xgct))
+        self.BendWeakWeb_Iyeff = res['Iyeff'][0]
+        self.BendWeakWeb_xgc = res['xgc'][0]
+        self.BendWeakWeb_xgct = res['xgct'][0]
+        self.BendWeakWeb_Wyeff = res['Wyeff'][0]
 
         self.Report += (f'==== Bending About Weak Axis, Web Is Under Compression ====\n'
                         f'{self.space3}σComEd : {self.scomed:.2f} MPa, Stress level\n'
                         f'{self.space3}Iyeff : {self.BendWeakWeb_Iyeff:.3f} mm⁴, Effective second moment area\n'
                         f'{self.space3}Wyeff : {self.BendWeakWeb_Wyeff :.3f} mm³, Effective section modulus\n')
 
-        # Print Report
-        print(self.Report)
-
     # ==================================================================================================================
     # PLOTTER FUNCTIONS
     # ==================================================================================================================
     def plot_effC_section(self):
+        import matplotlib.pyplot as plt
         figure, axis = plt.subplots(2, 2)
         figure.suptitle("Effective Section | EUROCODE 1993")
         for i in self.Axial_elementData2:
@@ -917,6 +541,7 @@ class SectionProp_C:
         plt.show()
 
     def plot_C_section(self):
+        import matplotlib.pyplot as plt
         t = self.x
         s = self.y
         fig, ax = plt.subplots()
@@ -928,5 +553,10 @@ class SectionProp_C:
         plt.show()
 
 
-# Calculating the section properties
-section = SectionProp_C(90.0, 45.0, 10.0, 1.2, 1.6, 350.0)
+if __name__ == '__main__':
+    # Calculating the section properties
+    section = SectionProp_C(90.0, 45.0, 10.0, 1.2, 1.6, 350.0, modes=MODES)
+    # Print Report
+    print(section.Report)
+    section.plot_C_section()
+    section.plot_effC_section()
@@ -0,0 +1,128 @@
+"""
+Persistent on-disk store of calculated section results (SQLite).
+Results are keyed by the section inputs and a hash of the calculation code, so they survive restarts and
+are shared between worker processes, while a change in the calculations never returns stale values.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+
+from PropertiesCalculator import SectionProp_C
+from SectionCache import canonicalKey
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Source files of the calculations, relative to the repository root
+CALC_FILES = ('PropertiesCalculator.py',
+              'BatchProperties.py',
+              'EffectiveSection/EN1993_1_5/Sec4Vec.py',
+              'EffectiveSection/EN1993_1_3/Sec5_5_3Vec.py',
+              'EffectiveSection/Modes/IntCalcProp.py',
+              'EffectiveSection/Modes/Pipeline.py')
+# Effective section results stored next to the gross properties
+EFFECTIVE_RESULTS = ('Axial_Aeff', 'BendStrong_Wxeff', 'BendWeakLip_Wyeff', 'BendWeakWeb_Wyeff')
+
+_version = None
+
+
+def codeVersion():
+    """Hash of the calculation source files, calculated once per process."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256()
+        for name in CALC_FILES:
+            h.update(name.encode())
+            with open(os.path.join(ROOT, name), 'rb') as file:
+                h.update(file.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+def sectionResults(section: SectionProp_C):
+    """
+    Stored results of a section.
+    :return: dict, 'prop' with the gross property values and the effective section results.
+    """
+    results = {'prop': {key: float(value[0]) for key, value in section.prop.items()}}
+    for name in EFFECTIVE_RESULTS:
+        results[name] = float(getattr(section, name))
+    return results
+
+
+class ResultStore:
+    """
+    SQLite store of section results. One file may be used by several processes at the same time.
+    """
+
+    def __init__(self, path: str, digits: int = 6, version: str = None):
+        """
+        :param path: Database file, created if missing.
+        :param digits: Rounding of the inputs for the keys, see SectionCache.
+        :param version: Code version of the stored results, codeVersion() by default.
+        """
+        self.path = path
+        self.digits = digits
+        self.version = codeVersion() if version is None else version
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(path, timeout=30.0, check_same_thread=False)
+        self._con.execute('PRAGMA journal_mode=WAL')
+        self._con.execute('CREATE TABLE IF NOT EXISTS results ('
+                          'A REAL, B REAL, C REAL, t REAL, R REAL, fy REAL, version TEXT, data TEXT, '
+                          'PRIMARY KEY (A, B, C, t, R, fy, version))')
+        self._con.commit()
+
+    def key(self, a: float, b: float, c: float, t: float, ro: float, f: float):
+        return canonicalKey((a, b, c, t, ro, f), self.digits) + (self.version,)
+
+    def load(self, a: float, b: float, c: float, t: float, ro: float, f: float):
+        """Stored results of the section, None if the section is not stored for this code version."""
+        with self._lock:
+            row = self._con.execute('SELECT data FROM results WHERE A=? AND B=? AND C=? AND t=? AND R=? AND fy=? '
+                                    'AND version=?', self.key(a, b, c, t, ro, f)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def save(self, section: SectionProp_C):
+        """Stores the results of the section, the missing ones are calculated."""
+        results = sectionResults(section)
+        key = self.key(section.A, section.B, section.C, section.t, section.R, section.scomed)
+        with self._lock:
+            self._con.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                              key + (json.dumps(results),))
+            self._con.commit()
+        return results
+
+    def results(self, a: float, b: float, c: float, t: float, ro: float, f: float):
+        """
+        Results of the section, loaded from the store or calculated and stored.
+        :return: dict, see sectionResults.
+        """
+        results = self.load(a, b, c, t, ro, f)
+        if results is not None:
+            self.hits += 1
+            return results
+        self.misses += 1
+        key = canonicalKey((a, b, c, t, ro, f), self.digits)
+        return self.save(SectionProp_C(*key))
+
+    def purge(self):
+        """Removes the results of other code versions. Returns the number of removed rows."""
+        with self._lock:
+            count = self._con.execute('DELETE FROM results WHERE version != ?', (self.version,)).rowcount
+            self._con.commit()
+        return count
+
+    def close(self):
+        self._con.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._con.execute('SELECT COUNT(*) FROM results WHERE version = ?', (self.version,)).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
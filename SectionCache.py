@@ -0,0 +1,127 @@
+"""
+In-process memoizing cache of SectionProp_C results.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from PropertiesCalculator import SectionProp_C
+
+
+def canonicalKey(values, digits: int):
+    """Section inputs rounded to `digits` decimals, negative zero is stored as zero."""
+    return tuple(round(float(i), digits) + 0.0 for i in values)
+
+
+class SectionCache:
+    """
+    Bounded LRU cache of calculated sections. The inputs (A, B, C, t, R, fy) are rounded to `digits`
+    decimals before the lookup, so values differing only by float noise share one entry.
+    """
+
+    def __init__(self, maxsize: int = 256, digits: int = 6):
+        """
+        :param maxsize: Maximum number of cached sections. The least recently used section is evicted.
+        :param digits: Rounding of the inputs, 6 means a tolerance of 1e-6 mm and MPa.
+        """
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1.')
+        self.maxsize = maxsize
+        self.digits = digits
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        # Futures of the sections being calculated
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def key(self, a: float, b: float, c: float, t: float, ro: float, f: float):
+        """Canonical key of the section inputs."""
+        return canonicalKey((a, b, c, t, ro, f), self.digits)
+
+    def get(self, a: float, b: float, c: float, t: float, ro: float, f: float, modes=()):
+        """
+        Returns the cached section, the section is calculated on a miss. The calculations run outside the lock
+        of the cache, concurrent misses of the same key wait for the first one.
+        :param modes: Load modes to be calculated before returning, see SectionProp_C.
+        :return: SectionProp_C
+        """
+        key = self.key(a, b, c, t, ro, f)
+        owner = False
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+            else:
+                future = self._pending.get(key)
+                if future is None:
+                    future = self._pending[key] = Future()
+                    owner = True
+                    self.misses += 1
+                else:
+                    self.hits += 1
+        if entry is None:
+            if owner:
+                entry = self._calculate(key, future)
+            else:
+                entry = future.result()
+        # Load modes of one section are calculated by one thread at a time
+        section, lock = entry
+        if modes:
+            with lock:
+                for mode in modes:
+                    section.calcMode(mode)
+        return section
+
+    def _calculate(self, key, future):
+        # Calculates the section of a miss and inserts it, the waiting threads get it from the future
+        try:
+            entry = (SectionProp_C(*key), threading.Lock())
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(error)
+            raise
+        with self._lock:
+            self._data[key] = entry
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            del self._pending[key]
+        future.set_result(entry)
+        return entry
+
+    def stats(self):
+        """Hit, miss and eviction counters and the current size."""
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'evictions': self.evictions,
+                    'size': len(self._data),
+                    'maxsize': self.maxsize}
+
+    def clear(self):
+        """Removes all sections and resets the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key):
+        key = self.key(*key)
+        with self._lock:
+            return key in self._data
+
+
+# Default cache of the process
+cache = SectionCache()
+
+
+def cachedSection(a: float, b: float, c: float, t: float, ro: float, f: float, modes=()):
+    """SectionProp_C from the default cache of the process."""
+    return cache.get(a, b, c, t, ro, f, modes)
@@ -0,0 +1,158 @@
+"""
+Precomputed catalog of lipped C sections, stored as one .npy file per column in a directory.
+Readers open the columns memory-mapped, so a lookup reads only the pages it needs.
+"""
+import json
+import os
+
+import numpy as np
+
+import BatchProperties as bprop
+import EffectiveSection.Modes.Pipeline as Pipeline
+from ResultStore import codeVersion
+from SectionCache import canonicalKey
+
+INPUTS = ('A', 'B', 'C', 't', 'R', 'fy')
+GROSS = ('Ag', 'zgx', 'zgy', 'Ix', 'Wx', 'Iy', 'Wy', 'Ixy', 'Iw', 'xsc', 'ysc', 'Cw', 'It', 'xo')
+EFFECTIVE = ('Axial_Aeff', 'Axial_dxgc', 'BendStrong_Ixeff', 'BendStrong_Wxeff', 'BendWeakLip_Iyeff',
+             'BendWeakLip_Wyeff', 'BendWeakWeb_Iyeff', 'BendWeakWeb_Wyeff')
+COLUMNS = INPUTS + GROSS + EFFECTIVE
+# Effective column: (load mode, result of Pipeline.EffectivePipeline.run)
+EFFECTIVE_KEYS = {'Axial_Aeff': ('AxialCompression', 'Aeff'),
+                  'Axial_dxgc': ('AxialCompression', 'dxgc'),
+                  'BendStrong_Ixeff': ('BendingStrong', 'Ixeff'),
+                  'BendStrong_Wxeff': ('BendingStrong', 'Wxeff'),
+                  'BendWeakLip_Iyeff': ('BendingWeakLip', 'Iyeff'),
+                  'BendWeakLip_Wyeff': ('BendingWeakLip', 'Wyeff'),
+                  'BendWeakWeb_Iyeff': ('BendingWeakWeb', 'Iyeff'),
+                  'BendWeakWeb_Wyeff': ('BendingWeakWeb', 'Wyeff')}
+META = 'meta.json'
+
+
+def _save(path: str, name: str, values):
+    # Written next to the old column and renamed, readers holding the old file keep a valid mapping
+    tmp = os.path.join(path, f'{name}.npy.tmp')
+    with open(tmp, 'wb') as file:
+        np.save(file, values)
+    os.replace(tmp, os.path.join(path, f'{name}.npy'))
+
+
+def effectiveProps(inputs, zgx, columns=EFFECTIVE):
+    """
+    Effective section properties of all rows at once with the batch EffectivePipeline.
+    :param inputs: Array with shape (n, 6), columns INPUTS.
+    :param zgx: Gross centre of gravity of the rows, see BatchProperties.grossProps.
+    :param columns: Effective columns, only the load modes of these columns are calculated.
+    :return: dict of arrays with shape (n,). Sections the calculation fails for are NaN.
+    """
+    A, B, C, t, R, fy = np.asarray(inputs, dtype=float).reshape(-1, len(INPUTS)).T
+    modes = {EFFECTIVE_KEYS[name][0] for name in columns}
+    if not modes:
+        return {}
+    with np.errstate(all='ignore'):
+        dims = bprop.lippedCDims(A, B, C, t, R)
+        geo = {key: dims[key].reshape(-1) for key in ('aa', 'bb', 'cc', 'tcore')}
+        geo['zgx'] = np.reshape(zgx, -1)
+        pipe = Pipeline.EffectivePipeline(geo, fy)
+        modes = {mode: pipe.run(mode) for mode in modes}
+    return {name: np.asarray(modes[EFFECTIVE_KEYS[name][0]][EFFECTIVE_KEYS[name][1]], dtype=float)
+            for name in columns}
+
+
+def buildCatalog(path: str, profiles, digits: int = 6):
+    """
+    Calculates the catalog and writes it to the directory. Rows of an existing catalog with the same
+    inputs and code version are reused, only new or changed rows are calculated.
+    :param path: Catalog directory, created if missing.
+    :param profiles: Rows of (A, B, C, t, R, fy).
+    :param digits: Rounding of the inputs, see SectionCache.
+    :return: dict, number of rows, reused rows and calculated rows.
+    """
+    version = codeVersion()
+    keys = [canonicalKey(i, digits) for i in profiles]
+    inputs = np.array(keys, dtype=float).reshape(-1, len(INPUTS))
+    n = len(inputs)
+    data = {name: np.full(n, np.nan) for name in GROSS + EFFECTIVE}
+    todo = np.ones(n, dtype=bool)
+
+    # Rows of the previous build
+    if os.path.exists(os.path.join(path, META)):
+        old = SectionCatalog(path, digits)
+        if set(COLUMNS) <= set(old.columns):
+            index = old.index()
+            found = np.array([index.get(key, -1) for key in keys], dtype=int).reshape(n)
+            same = found >= 0
+            same[same] = old.column('version')[found[same]] == version.encode()
+            todo[same] = False
+            for name in GROSS + EFFECTIVE:
+                data[name][same] = old.column(name)[found[same]]
+        del old
+
+    rows = np.flatnonzero(todo)
+    if len(rows):
+        # Gross and effective properties of all new rows at once
+        gross = bprop.grossProps(*inputs[rows, :5].T)
+        for name in GROSS:
+            data[name][rows] = gross[name]
+        effective = effectiveProps(inputs[rows], gross['zgx'])
+        for name in EFFECTIVE:
+            data[name][rows] = effective[name]
+
+    os.makedirs(path, exist_ok=True)
+    for j, name in enumerate(INPUTS):
+        _save(path, name, inputs[:, j])
+    for name in GROSS + EFFECTIVE:
+        _save(path, name, data[name])
+    _save(path, 'version', np.full(n, version, dtype='S16'))
+    with open(os.path.join(path, META + '.tmp'), 'w') as file:
+        json.dump({'rows': n, 'version': version, 'columns': list(COLUMNS) + ['version']}, file)
+    os.replace(os.path.join(path, META + '.tmp'), os.path.join(path, META))
+    return {'rows': n, 'reused': n - len(rows), 'calculated': len(rows)}
+
+
+class SectionCatalog:
+    """
+    Read-only, memory-mapped view of a catalog written by buildCatalog.
+    """
+
+    def __init__(self, path: str, digits: int = 6):
+        self.path = path
+        self.digits = digits
+        with open(os.path.join(path, META)) as file:
+            meta = json.load(file)
+        self.rows = meta['rows']
+        self.version = meta['version']
+        self.columns = tuple(meta['columns'])
+        self._data = {}
+        self._index = None
+
+    def column(self, name: str):
+        """Memory-mapped column."""
+        if name not in self._data:
+            if name not in self.columns:
+                raise KeyError(f'No column {name} in the catalog.')
+            self._data[name] = np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')
+        return self._data[name]
+
+    def index(self):
+        """Row numbers of the inputs, built on the first lookup."""
+        if self._index is None:
+            inputs = np.column_stack([self.column(i) for i in INPUTS])
+            self._index = {canonicalKey(row, self.digits): i for i, row in enumerate(inputs.tolist())}
+        return self._index
+
+    def row(self, i: int):
+        """Values of all columns of the row."""
+        return {name: float(self.column(name)[i]) for name in COLUMNS}
+
+    def lookup(self, a: float, b: float, c: float, t: float, ro: float, f: float):
+        """Values of the section, None if the section is not in the catalog."""
+        i = self.index().get(canonicalKey((a, b, c, t, ro, f), self.digits))
+        return None if i is None else self.row(i)
+
+    def isCurrent(self):
+        """True if every row was calculated with the current code."""
+        return bool(np.all(self.column('version') == codeVersion().encode()))
+
+    def __len__(self):
+        return self.rows
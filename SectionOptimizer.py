@@ -0,0 +1,137 @@
+"""
+Minimum weight lipped C section for effective section targets at a design stress.
+The feasible candidates of a DesignSpace grid are pruned chunk by chunk with upper bounds of the effective
+properties and the remaining candidates are sorted by gross area. They are evaluated in batches through the
+vectorized effective section pipeline, the search stops at the first batch with a section that satisfies the
+targets, all later batches are heavier.
+"""
+import numpy as np
+
+import BatchProperties as bprop
+import BatchRunner as br
+from DesignSpace import DesignSpace, DEFAULT_RULES
+
+# Target: (result column, 'min' lower bound or 'max' upper bound of the absolute value)
+TARGETS = {'Wxeff': ('BendStrong_Wxeff', 'min'),
+           'Aeff': ('Axial_Aeff', 'min'),
+           'eN': ('Axial_dxgc', 'max')}
+# Largest distortional reduction factor of Sec5_5_3Vec.thk_reduction, 1.47 - 0.723.λd is just above 1 at λd = 0.65
+XD_MAX = 1.47 - 0.723 * 0.65
+# Round-off allowance of the upper bounds
+BOUND_TOL = 1e-9
+# Bisection steps for the neutral axis of the Wxeff bound
+BOUND_STEPS = 60
+
+
+def _interval(F, lo, hi):
+    # Integral with the antiderivative F over [lo, hi], zero for empty intervals
+    return np.where(hi > lo, F(np.maximum(hi, lo)) - F(lo), 0.0)
+
+
+def _moments(g, aa, bb, cc):
+    """
+    Integrals of (g - y).(aa - y) below y = g and y.(y - g) above y = g over the sharp centreline section with unit
+    thickness: flanges at y = 0 and y = aa, web from 0 to aa, lips from 0 to cc and from aa - cc to aa.
+    """
+    def below(y):
+        return g * aa * y - (g + aa) * y ** 2 / 2 + y ** 3 / 3
+
+    def above(y):
+        return y ** 3 / 3 - g * y ** 2 / 2
+
+    low = bb * g * aa + _interval(below, 0.0, g) + _interval(below, 0.0, np.minimum(g, cc)) + \
+        _interval(below, aa - cc, g)
+    high = bb * aa * (aa - g) + _interval(above, g, aa) + _interval(above, g, cc) + \
+        _interval(above, np.maximum(g, aa - cc), aa)
+    return low, high
+
+
+def upperBounds(rows):
+    """
+    Upper bounds of Aeff and Wxeff = Ixeff / (aa - ygc) of the effective section calculation. Every effective
+    section is a part of the sharp centreline section with the thickness tcore, reduced by at most XD_MAX.
+    With the centre of gravity g of the effective section, Ixeff is the integral of (g - y).(aa - y) and of
+    y.(y - g), so Wxeff is less than the parts of the integrals over the full section where they are positive,
+    P(g) below g increases and Q(g) above g decreases with g. The bound is min(P, Q) at their intersection,
+    found by bisection. It is typically 5 to 15 % above the Wx of the fully effective section.
+    :param rows: Array with shape (n, 5) or (n, 6), columns A, B, C, t, R[, fy].
+    :return: dict of arrays, Aeff, Wxeff.
+    """
+    d = bprop.lippedCDims(*np.asarray(rows, dtype=float)[:, :5].T)
+    tc, aa, bb, cc = d['tcore'], d['aa'], d['bb'], d['cc']
+    lo, hi = np.zeros_like(aa), aa.copy()
+    for _ in range(BOUND_STEPS):
+        g = (lo + hi) / 2
+        low, high = _moments(g, aa, bb, cc)
+        up = low < high
+        lo, hi = np.where(up, g, lo), np.where(up, hi, g)
+    # The intersection is between lo and hi, P(hi) and Q(lo) are both above min(P, Q) there
+    W = np.minimum(_moments(hi, aa, bb, cc)[0] / (aa - hi), _moments(lo, aa, bb, cc)[1] / (aa - lo))
+    return {'Aeff': XD_MAX * tc * (aa + 2 * bb + 2 * cc), 'Wxeff': XD_MAX * tc * W}
+
+
+def satisfies(res, targets):
+    """Candidates of the result columns meeting all targets, boolean array."""
+    ok = True
+    for name, value in targets.items():
+        column, kind = TARGETS[name]
+        ok = ok & (res[column] >= value if kind == 'min' else np.abs(res[column]) <= value)
+    return ok
+
+
+def minimumWeight(grid, fy: float, R: float, Wxeff: float = None, Aeff: float = None, eN: float = None,
+                  batchSize: int = 256, rules=DEFAULT_RULES, jobs: int = 1):
+    """
+    Lightest section of the grid meeting the targets. The grid is enumerated lazily, the flat grid indices and
+    gross areas of the candidates passing the upper bounds are kept in memory (16 bytes per candidate) for the
+    sort by area.
+    :param grid: dict of A, B, C, t, each a sequence of values.
+    :param fy: Design stress (MPa).
+    :param R: Inner corner radius.
+    :param Wxeff: Minimum effective section modulus, bending about the strong axis (mm³).
+    :param Aeff: Minimum effective area under axial compression (mm²).
+    :param eN: Maximum shift of the centre of gravity under axial compression (mm).
+    :param batchSize: Candidates evaluated together.
+    :param rules: Feasibility rules, see DesignSpace.
+    :param jobs: Number of processes, batches are evaluated ahead of the search on a process pool.
+    :return: dict, section (dict of A, B, C, t, R, fy, Ag and the target columns, None if no section meets the
+    targets) and stats.
+    """
+    targets = {name: value for name, value in (('Wxeff', Wxeff), ('Aeff', Aeff), ('eN', eN)) if value is not None}
+    if not targets:
+        raise ValueError(f'Give at least one target of {tuple(TARGETS)}.')
+    space = DesignSpace({**grid, 'R': [R], 'fy': [fy]}, rules, chunkSize=max(batchSize, 4096))
+
+    # Upper bounds per chunk, a candidate which cannot reach the targets with them is dominated
+    kept, areas, bounded = [], [], 0
+    for index, rows in space.feasible():
+        bound = upperBounds(rows)
+        keep = np.ones(len(rows), dtype=bool)
+        for name in ('Wxeff', 'Aeff'):
+            if name in targets:
+                keep &= bound[name] * (1 + BOUND_TOL) >= targets[name]
+        bounded += int(np.sum(~keep))
+        kept.append(index[keep])
+        areas.append(bprop.grossProps(*rows[keep, :5].T)['Ag'].reshape(-1))
+    stats = {'candidates': space.stats['candidates'], 'feasible': space.stats['feasible'],
+             'rules': space.stats['rules'], 'bounded': bounded, 'evaluated': 0, 'batches': 0}
+    index = np.concatenate(kept or [np.zeros(0, dtype=np.int64)])
+    Ag = np.concatenate(areas or [np.zeros(0)])
+    order = np.argsort(Ag, kind='stable')
+    index, Ag = index[order], Ag[order]
+
+    columns = [TARGETS[name][0] for name in targets]
+    batches = (space.rows(index[i:i + batchSize]) for i in range(0, len(index), batchSize))
+    section = None
+    for start, res in zip(range(0, len(index), batchSize), br.calculateChunks(batches, jobs, columns)):
+        stats['batches'] += 1
+        stats['evaluated'] += len(res[columns[0]])
+        ok = np.flatnonzero(satisfies(res, targets))
+        if len(ok):
+            # Sorted by area, the first section meeting the targets is the lightest
+            i = ok[0]
+            section = dict(zip(br.INPUTS, space.rows(index[start + i:start + i + 1])[0].tolist()))
+            section['Ag'] = float(Ag[start + i])
+            section.update({column: float(res[column][i]) for column in columns})
+            break
+    return {'section': section, 'stats': stats}
@@ -0,0 +1,86 @@
+"""
+Finite strip signature curves, the first buckling load factor over the half-wavelength, of one or many sections.
+The half-wavelengths of a section are split into contiguous chunks which are solved in a process pool. Within a
+chunk the length-independent strip matrices are assembled once (FiniteStrip.StripModel) and every eigen solve
+starts from the mode shape of the previous length.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import FiniteStrip as fsm
+
+
+def halfWavelengths(lmin: float = 10.0, lmax: float = 10000.0, count: int = 100):
+    """Logarithmically spaced half-wavelengths (mm)."""
+    return np.logspace(np.log10(lmin), np.log10(lmax), count)
+
+
+def _chunks(count: int, chunks: int):
+    # Slices of contiguous lengths
+    edges = np.linspace(0, count, min(max(chunks, 1), count) + 1).round().astype(int)
+    return [slice(a, b) for a, b in zip(edges[:-1], edges[1:])]
+
+
+def _curve(task):
+    # Load factors of one section at a chunk of lengths, module level function for the process pool
+    nodes, elements, stress, lengths, modes, E, v = task
+    return fsm.buckling(nodes, elements, lengths, stress, modes, E, v)[0]
+
+
+def minima(lengths, factors):
+    """
+    Local and distortional minima of a signature curve. The first local minimum of the curve is the local buckling
+    and the second the distortional buckling, CUFSM convention. NaN if the curve has no such minimum.
+    :param factors: Load factors of the first mode at the lengths.
+    :return: dict, local, Llocal, distortional, Ldist.
+    """
+    f = np.asarray(factors, dtype=float)
+    inner = np.flatnonzero((f[1:-1] < f[:-2]) & (f[1:-1] <= f[2:])) + 1
+    res = {'local': np.nan, 'Llocal': np.nan, 'distortional': np.nan, 'Ldist': np.nan}
+    for (value, length), index in zip((('local', 'Llocal'), ('distortional', 'Ldist')), inner):
+        res[value], res[length] = f[index], lengths[index]
+    return res
+
+
+def signatureCurves(sections, lengths=None, modes: int = 1, jobs: int = None, chunks: int = 1,
+                    E: float = fsm.E, v: float = fsm.v):
+    """
+    Signature curves of several sections.
+    :param sections: Sequence of (nodes, elements, stress), stress of the nodes or None for column 7 of nodes.
+    :param lengths: Half-wavelengths, halfWavelengths() if None.
+    :param modes: Number of buckling modes at every length.
+    :param jobs: Number of processes, os.cpu_count() if None, 1 calculates in this process.
+    :param chunks: Number of length chunks of every section. More chunks give more parallel tasks, fewer chunks
+    more reuse of the matrices and warm starts.
+    :return: dict, lengths, factors with shape (sections, lengths, modes) and arrays (sections,) of local, Llocal,
+    distortional, Ldist of the first mode, see minima.
+    """
+    lengths = halfWavelengths() if lengths is None else np.asarray(lengths, dtype=float).reshape(-1)
+    parts = _chunks(len(lengths), chunks)
+    tasks = [(nodes, elements, stress, lengths[part], modes, E, v)
+             for nodes, elements, stress in sections for part in parts]
+    jobs = (os.cpu_count() or 1) if jobs is None else jobs
+    if jobs == 1 or len(tasks) == 1:
+        results = list(map(_curve, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            results = list(pool.map(_curve, tasks, chunksize=max(1, len(tasks) // (4 * jobs))))
+    factors = np.array([np.concatenate(results[i:i + len(parts)]) for i in range(0, len(results), len(parts))])
+    res = {'lengths': lengths, 'factors': factors}
+    found = [minima(lengths, curve[:, 0]) for curve in factors]
+    res.update({key: np.array([i[key] for i in found]) for key in ('local', 'Llocal', 'distortional', 'Ldist')})
+    return res
+
+
+def signatureCurve(nodes, elements, lengths=None, stress=None, modes: int = 1, jobs: int = None,
+                   chunks: int = None, E: float = fsm.E, v: float = fsm.v):
+    """
+    Signature curve of one section, the lengths are split into one chunk per process by default.
+    :return: dict, lengths, factors with shape (lengths, modes), local, Llocal, distortional, Ldist.
+    """
+    jobs = (os.cpu_count() or 1) if jobs is None else jobs
+    res = signatureCurves([(nodes, elements, stress)], lengths, modes, jobs, jobs if chunks is None else chunks,
+                          E, v)
+    return {key: value[0] if key != 'lengths' else value for key, value in res.items()}
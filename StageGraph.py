@@ -0,0 +1,115 @@
+"""
+Dependency graph of the calculation stages of lipped C sections.
+Every stage is memoized with the versions of its inputs. Changing an input recalculates only the stages
+downstream of it, e.g. a new fy keeps the nodes and the gross properties, a new t keeps the corner basis.
+"""
+import numpy as np
+
+import BatchProperties as bprop
+import EffectiveSection.Modes.Pipeline as Pipeline
+
+INPUTS = ('A', 'B', 'C', 't', 'R', 'fy')
+
+
+def _geometry(dims, gross):
+    geo = {key: dims[key].reshape(-1) for key in ('aa', 'bb', 'cc', 'tcore')}
+    geo['zgx'] = gross['zgx'].reshape(-1)
+    return geo
+
+
+def _plates(geo, fy):
+    # A stress sweep of one section broadcasts the geometry to the stresses
+    fy = np.reshape(fy, -1)
+    n = max(len(geo['bb']), len(fy))
+    geo = {key: np.broadcast_to(value, (n,)) for key, value in geo.items()}
+    return Pipeline.EffectivePipeline(geo, fy)
+
+
+def _mode(mode):
+    def run(pipeline):
+        return pipeline.run(mode)
+    return run
+
+
+# Stage name: (dependencies, function of the dependency values)
+STAGES = {'arcBasis': ((), bprop.cornerBasis),
+          'dims': (('A', 'B', 'C', 't', 'R'), bprop.lippedCDims),
+          'nodes': (('dims', 'arcBasis'), bprop.nodesFromDims),
+          'gross': (('nodes', 't', 'dims'), lambda nodes, t, dims: bprop.grossFromNodes(*nodes, t, dims['r'])),
+          'geometry': (('dims', 'gross'), _geometry),
+          # Per-plate reductions, memoized in the pipeline and shared by the load modes
+          'plates': (('geometry', 'fy'), _plates)}
+# Effective element matrix and effective properties of the load modes
+STAGES.update({mode: (('plates',), _mode(mode)) for mode in Pipeline.MODE_SPECS})
+
+
+class StageGraph:
+    """
+    Memoized calculation stages of one section or of arrays of sections.
+    """
+
+    def __init__(self, **inputs):
+        """
+        :param inputs: A, B, C, t, R, fy as scalars or equally shaped arrays.
+        """
+        self._values = {}
+        self._versions = {}
+        self._keys = {}
+        # Status of the stages evaluated since the last update, 'calculated' or 'reused'
+        self.report = {}
+        self.stats = {'calculated': 0, 'reused': 0}
+        missing = set(INPUTS) - set(inputs)
+        if missing:
+            raise ValueError(f'Missing inputs {sorted(missing)}.')
+        self.update(**inputs)
+
+    def update(self, **inputs):
+        """
+        Changes the inputs. Stages are recalculated on the next access if they depend on a changed input.
+        :return: set of the changed inputs.
+        """
+        changed = set()
+        for name, value in inputs.items():
+            if name not in INPUTS:
+                raise ValueError(f'Unknown input {name}, use one of {INPUTS}.')
+            value = np.asarray(value, dtype=float)
+            if name in self._values and np.array_equal(self._values[name], value):
+                continue
+            self._values[name] = value
+            self._versions[name] = self._versions.get(name, 0) + 1
+            changed.add(name)
+        self.report = {}
+        return changed
+
+    def get(self, name: str):
+        """Value of the input or stage, the stages it depends on are evaluated first."""
+        if name in INPUTS:
+            return self._values[name]
+        if name not in STAGES:
+            raise KeyError(f'No stage {name}, use one of {tuple(STAGES)}.')
+        deps, func = STAGES[name]
+        values = [self.get(i) for i in deps]
+        key = tuple(self._versions[i] for i in deps)
+        if name in self._values and self._keys[name] == key:
+            status = 'reused'
+        else:
+            status = 'calculated'
+            self._values[name] = func(*values)
+            self._keys[name] = key
+            self._versions[name] = self._versions.get(name, 0) + 1
+        # A stage needed by several others is reported by its first evaluation
+        self.report.setdefault(name, status)
+        self.stats[status] += 1
+        return self._values[name]
+
+    def mode(self, mode: str):
+        """Effective section of the load mode, see Pipeline.EffectivePipeline.run."""
+        return self.get(mode)
+
+    def reused(self):
+        """Stages reused since the last update."""
+        return [name for name, status in self.report.items() if status == 'reused']
+
+    def calculated(self):
+        """Stages calculated since the last update."""
+        return [name for name, status in self.report.items() if status == 'calculated']
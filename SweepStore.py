@@ -0,0 +1,163 @@
+"""
+Resumable parametric sweep over the grid A × B × C × t × R × fy, stored in a directory.
+Every result column is a preallocated .npy file written through np.memmap, the row number is the flat index
+of the grid point. Finished chunks are recorded in a completion bitmap, which is checkpointed after the
+chunk columns are flushed, so a restarted sweep continues with the first unfinished chunk.
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+import BatchRunner as br
+from ResultStore import codeVersion
+from SectionCatalog import INPUTS, GROSS, EFFECTIVE
+
+META = 'meta.json'
+DONE = 'done.npy'
+
+
+def gridRows(grid, rows):
+    """
+    Inputs of grid points.
+    :param grid: dict of INPUTS, each a sequence of values.
+    :param rows: Flat indices of the grid points, C order of INPUTS.
+    :return: Array with shape (len(rows), 6).
+    """
+    axes = [np.asarray(grid[name], dtype=float).reshape(-1) for name in INPUTS]
+    index = np.unravel_index(np.asarray(rows, dtype=np.int64), [len(i) for i in axes])
+    return np.column_stack([axis[i] for axis, i in zip(axes, index)])
+
+
+def _write(path: str, data: dict):
+    # Written next to the old file and renamed, a crash leaves either the old or the new file
+    with open(path + '.tmp', 'w') as file:
+        json.dump(data, file)
+    os.replace(path + '.tmp', path)
+
+
+class SweepStore:
+    """
+    Memory-mapped columns of a sweep with a completion bitmap of the chunks.
+    """
+
+    def __init__(self, path: str, grid=None, columns=None, chunkSize: int = 4096):
+        """
+        :param path: Store directory. An existing store is opened, a new one needs the grid.
+        :param grid: dict of INPUTS, each a sequence of values. Must match the grid of an existing store.
+        :param columns: Stored result columns of BatchRunner.COLUMNS (column projection), GROSS and EFFECTIVE
+        if None. Only the load modes of the stored columns are calculated.
+        :param chunkSize: Rows calculated and checkpointed together.
+        """
+        self.path = path
+        meta = os.path.join(path, META)
+        if os.path.exists(meta):
+            with open(meta) as file:
+                self.meta = json.load(file)
+            if grid is not None and self._grid(grid) != self.meta['grid']:
+                raise ValueError(f'Sweep store {path} has another grid, use a new directory.')
+            if columns is not None and list(columns) != self.meta['columns']:
+                raise ValueError(f'Sweep store {path} has the columns {self.meta["columns"]}.')
+        else:
+            if grid is None:
+                raise ValueError(f'No sweep store in {path}, give the grid to create one.')
+            columns = list(GROSS + EFFECTIVE if columns is None else columns)
+            unknown = set(columns) - set(br.COLUMNS)
+            if unknown:
+                raise ValueError(f'Unknown columns {sorted(unknown)}, use any of {br.COLUMNS}.')
+            if chunkSize < 1:
+                raise ValueError('Chunk size must be positive.')
+            grid = self._grid(grid)
+            rows = int(np.prod([len(grid[name]) for name in INPUTS]))
+            self.meta = {'grid': grid, 'columns': columns, 'rows': rows, 'chunkSize': chunkSize,
+                         'chunks': -(-rows // chunkSize), 'version': codeVersion()}
+            os.makedirs(path, exist_ok=True)
+            for name in columns:
+                data = np.lib.format.open_memmap(self._file(name), mode='w+', dtype=float, shape=(rows,))
+                data[:] = np.nan
+                data.flush()
+                del data
+            self.done = np.zeros(self.meta['chunks'], dtype=bool)
+            self.checkpoint()
+            _write(meta, self.meta)
+        self.columns = tuple(self.meta['columns'])
+        self.rows = self.meta['rows']
+        self.chunkSize = self.meta['chunkSize']
+        self.chunks = self.meta['chunks']
+        self.done = np.unpackbits(np.load(os.path.join(path, DONE)), count=self.chunks).astype(bool)
+        if self.meta['version'] != codeVersion():
+            # Results of another code version are calculated again
+            self.done[:] = False
+            self.meta['version'] = codeVersion()
+            self.checkpoint()
+            _write(meta, self.meta)
+        self._data = {name: np.load(self._file(name), mmap_mode='r+') for name in self.columns}
+
+    @staticmethod
+    def _grid(grid):
+        missing = set(INPUTS) - set(grid)
+        if missing:
+            raise ValueError(f'Missing grid axes {sorted(missing)}.')
+        return {name: [float(i) for i in np.reshape(grid[name], -1)] for name in INPUTS}
+
+    def _file(self, name: str):
+        return os.path.join(self.path, f'{name}.npy')
+
+    def checkpoint(self):
+        """Writes the completion bitmap."""
+        tmp = os.path.join(self.path, DONE + '.tmp')
+        with open(tmp, 'wb') as file:
+            np.save(file, np.packbits(self.done))
+        os.replace(tmp, os.path.join(self.path, DONE))
+
+    def chunkRows(self, chunk: int):
+        """Row numbers of the chunk."""
+        return np.arange(chunk * self.chunkSize, min((chunk + 1) * self.chunkSize, self.rows))
+
+    def inputs(self, rows):
+        """Inputs of the rows, see gridRows."""
+        return gridRows(self.meta['grid'], rows)
+
+    def pending(self):
+        """Chunks not finished yet."""
+        return np.flatnonzero(~self.done)
+
+    def isComplete(self):
+        return bool(np.all(self.done))
+
+    def column(self, name: str):
+        """Memory-mapped column, NaN in the rows not calculated yet."""
+        if name not in self._data:
+            raise KeyError(f'No column {name} in the sweep store.')
+        return self._data[name]
+
+    def run(self, jobs: int = 1, maxChunks: int = None, progress=None):
+        """
+        Calculates the unfinished chunks. Every chunk is flushed and checkpointed when it is written, an
+        interrupted run is continued by calling run again, also from a new process.
+        :param jobs: Number of processes, see BatchRunner.run.
+        :param maxChunks: Calculate at most this many chunks, all if None.
+        :param progress: Called with (finished chunks, all chunks) after every chunk.
+        :return: dict of the run statistics, see BatchRunner.runStats.
+        """
+        todo = self.pending()[:maxChunks]
+        jobs = (os.cpu_count() or 1) if jobs is None else jobs
+        start = time.perf_counter()
+        rows = failed = 0
+        chunks = (self.inputs(self.chunkRows(i)) for i in todo)
+        for chunk, res in zip(todo, br.calculateChunks(chunks, min(jobs, max(len(todo), 1)), self.columns)):
+            part = self.chunkRows(chunk)
+            for name in self.columns:
+                self._data[name][part[0]:part[-1] + 1] = res[name]
+                self._data[name].flush()
+            self.done[chunk] = True
+            self.checkpoint()
+            rows += len(part)
+            failed += br.failedRows(res)
+            if progress is not None:
+                progress(int(np.sum(self.done)), self.chunks)
+        return br.runStats(rows, len(todo), jobs, time.perf_counter() - start, failed)
+
+    def __len__(self):
+        return self.rows
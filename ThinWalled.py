@@ -0,0 +1,238 @@
+"""
+General open thin-walled cross-sections given as CUFSM-style node and element arrays.
+nodes: [id, x, y, 4 DOF flags, stress], elements: [id, node i, node j, thickness, material].
+Sections of the same topology (same element connectivity) are evaluated together, the node coordinates
+and the element thicknesses may differ between the sections.
+"""
+from collections import deque
+
+import numpy as np
+
+import BatchProperties as bprop
+
+# DOF flags and stress of the generated nodes
+NODE_FLAGS = (1, 1, 1, 1, 0)
+
+
+def pathMatrix(i, j, count: int):
+    """
+    Elements on the path from the first node of the first element to every node.
+    :param i: Start nodes of the elements.
+    :param j: End nodes of the elements.
+    :param count: Number of nodes.
+    :return: Array with shape (count, elements), +1 if the path runs from i to j, -1 if it runs from j to i.
+    """
+    i, j = np.asarray(i, dtype=int), np.asarray(j, dtype=int)
+    adjacent = [[] for _ in range(count)]
+    for e, (a, b) in enumerate(zip(i, j)):
+        adjacent[a].append((b, e, 1.0))
+        adjacent[b].append((a, e, -1.0))
+    path = np.zeros([count, len(i)])
+    seen = np.zeros(count, dtype=bool)
+    root = i[0]
+    seen[root] = True
+    queue = deque([root])
+    used = 0
+    while queue:
+        node = queue.popleft()
+        for other, e, sign in adjacent[node]:
+            if seen[other]:
+                continue
+            seen[other] = True
+            path[other] = path[node]
+            path[other, e] = sign
+            used += 1
+            queue.append(other)
+    if used != len(i):
+        raise ValueError('Only connected open sections are supported (no closed cells or separate parts).')
+    return path
+
+
+def _batch(nodes, elements):
+    # Arrays with a leading section axis
+    nodes = np.asarray(nodes, dtype=float)
+    elements = np.asarray(elements, dtype=float)
+    single = nodes.ndim == 2
+    if single:
+        nodes = nodes[np.newaxis]
+    if elements.ndim == 2:
+        elements = np.broadcast_to(elements, (len(nodes),) + elements.shape)
+    return nodes, elements, single
+
+
+def sectionProps(nodes, elements):
+    """
+    Gross section properties, shear centre and warping constant of open thin-walled sections.
+    The sectorial coordinate has its pole at the origin and is zero at the first node of the first element.
+    :param nodes: Array with shape (nodes, 8) or (sections, nodes, 8).
+    :param elements: Array with shape (elements, 5) or (sections, elements, 5). Connectivity of the first section
+    is used for all.
+    :return: dict of floats or arrays, Ag, zgx, zgy, Ix, Wx, Iy, Wy, Ixy, Iw, xsc, ysc, Cw, It, xo.
+    Wx and Wy are calculated without the reduction for rounded corners.
+    """
+    nodes, elements, single = _batch(nodes, elements)
+    i = elements[0, :, 1].astype(int)
+    j = elements[0, :, 2].astype(int)
+    t = elements[:, :, 3]
+    x, y = nodes[:, :, 1], nodes[:, :, 2]
+    xi, xj, yi, yj = x[:, i], x[:, j], y[:, i], y[:, j]
+    # Sectorial coordinates of the nodes
+    w = (xi * yj - xj * yi) @ pathMatrix(i, j, nodes.shape[1]).T
+    wi, wj = w[:, i], w[:, j]
+    ba = np.sqrt((xi - xj) ** 2 + (yi - yj) ** 2)
+    da = ba * t
+    Ar = np.sum(da, axis=1)
+    # First moment of area and coordinate for gravity centre
+    Sx0 = np.sum((yj + yi) * da / 2, axis=1)
+    Sy0 = np.sum((xj + xi) * da / 2, axis=1)
+    zgy = Sx0 / Ar
+    zgx = Sy0 / Ar
+    # Second moment and product moment of area
+    Ix = np.sum((yj ** 2 + yi ** 2 + yj * yi) * da / 3, axis=1) - Ar * zgy ** 2
+    Iy = np.sum((xj ** 2 + xi ** 2 + xj * xi) * da / 3, axis=1) - Ar * zgx ** 2
+    Ixy = np.sum((2 * xi * yi + 2 * xj * yj + xi * yj + xj * yi) * da / 6, axis=1) - Sx0 * Sy0 / Ar
+    # Sectorial constants
+    Iw = np.sum((wi + wj) * da / 2, axis=1)
+    Ixw = np.sum((2 * xi * wi + 2 * xj * wj + xi * wj + xj * wi) * da / 6, axis=1) - Sy0 * Iw / Ar
+    Iyw = np.sum((2 * yi * wi + 2 * yj * wj + yi * wj + yj * wi) * da / 6, axis=1) - Sx0 * Iw / Ar
+    Iww = np.sum((wj ** 2 + wi ** 2 + wj * wi) * da / 3, axis=1) - Iw ** 2 / Ar
+    # Shear centre
+    xsc = (Iyw * Iy - Ixw * Ixy) / (Ix * Iy - Ixy ** 2)
+    ysc = (-Ixw * Ix + Iyw * Ixy) / (Ix * Iy - Ixy ** 2)
+    # Distances from the boundaries of the used nodes
+    used = np.unique(np.concatenate([i, j]))
+    zy = np.maximum(zgy - np.min(y[:, used], axis=1), np.max(y[:, used], axis=1) - zgy)
+    zx = np.maximum(zgx - np.min(x[:, used], axis=1), np.max(x[:, used], axis=1) - zgx)
+    prop = {'Ag': Ar,
+            'zgx': zgx,
+            'zgy': zgy,
+            'Ix': Ix,
+            'Wx': Ix / zy,
+            'Iy': Iy,
+            'Wy': Iy / zx,
+            'Ixy': Ixy,
+            'Iw': Iw,
+            'xsc': xsc,
+            'ysc': ysc,
+            'Cw': Iww + ysc * Ixw - xsc * Iyw,
+            'It': np.sum(ba * t ** 3, axis=1) / 3,
+            'xo': np.abs(xsc) + zgx}
+    return {key: value[0] for key, value in prop.items()} if single else prop
+
+
+# ======================================================================================================================
+# POLYLINE SECTIONS
+# ======================================================================================================================
+def polylineSection(points, t, r=0.0, chords: int = bprop.CHORDS):
+    """
+    Nodes and elements of open sections along centreline polylines, the inner vertices are rounded with arcs.
+    :param points: Vertices with shape (vertices, 2) or (sections, vertices, 2).
+    :param t: Thickness of every section.
+    :param r: Centreline radius of the corners, 0.0 for sharp corners. All sections of a batch are either sharp
+    or rounded.
+    :param chords: Number of chords in each rounded corner.
+    :return: nodes, elements with the shapes of SectionProp_C.nodes and .elements, with a leading section axis
+    for several sections.
+    """
+    points = np.asarray(points, dtype=float)
+    single = points.ndim == 2
+    if single:
+        points = points[np.newaxis]
+    n = len(points)
+    r = np.broadcast_to(np.asarray(r, dtype=float), (n,)).reshape(-1, 1)
+    t = np.broadcast_to(np.asarray(t, dtype=float), (n,))
+    # Sections of one batch share the topology, rounded corners have more nodes than sharp ones
+    rounded = r > 0.0
+    if np.any(rounded) and not np.all(rounded):
+        raise ValueError('Sharp (r = 0) and rounded (r > 0) sections have different nodes, '
+                         'build them in separate batches.')
+    length = np.linalg.norm(np.diff(points, axis=1), axis=2)
+    if not np.all(length > 0.0):
+        raise ValueError(f'Sections {np.flatnonzero(~np.all(length > 0.0, axis=1)).tolist()} have repeated '
+                         'vertices, the segments need a length.')
+    # Tangent lengths of the arcs at the vertices
+    tangent = np.zeros(points.shape[:2])
+    parts = [points[:, :1]]
+    for k in range(1, points.shape[1] - 1):
+        p = points[:, k]
+        u = (p - points[:, k - 1]) / length[:, k - 1:k]
+        v = (points[:, k + 1] - p) / length[:, k:k + 1]
+        # Signed turning angle, positive to the left
+        turn = np.arctan2(u[:, 0] * v[:, 1] - u[:, 1] * v[:, 0], np.sum(u * v, axis=1))[:, np.newaxis]
+        if not np.any(rounded):
+            parts.append(p[:, np.newaxis])
+            continue
+        d = r * np.tan(np.abs(turn) / 2)
+        tangent[:, k] = d[:, 0]
+        start = p - d * u
+        left = np.column_stack([-u[:, 1], u[:, 0]])
+        centre = start + r * np.sign(turn) * left
+        a0 = np.arctan2(start[:, 1] - centre[:, 1], start[:, 0] - centre[:, 0])[:, np.newaxis]
+        ang = a0 + turn * np.arange(1, chords) / chords
+        arc = np.stack([centre[:, :1] + r * np.cos(ang), centre[:, 1:] + r * np.sin(ang)], axis=-1)
+        parts += [start[:, np.newaxis], arc, (p + d * v)[:, np.newaxis]]
+    overlap = tangent[:, :-1] + tangent[:, 1:] > length
+    if np.any(overlap):
+        raise ValueError(f'Corner radius too large for sections {np.flatnonzero(overlap.any(axis=1)).tolist()}, '
+                         'the arcs do not fit in the adjacent segments.')
+    parts.append(points[:, -1:])
+    xy = np.concatenate(parts, axis=1)
+    count = xy.shape[1]
+    nodes = np.empty([n, count, 8])
+    nodes[:, :, 0] = np.arange(count)
+    nodes[:, :, 1:3] = xy
+    nodes[:, :, 3:] = NODE_FLAGS
+    elements = np.zeros([n, count - 1, 5])
+    elements[:, :, 0] = np.arange(count - 1)
+    elements[:, :, 1] = np.arange(count - 1)
+    elements[:, :, 2] = np.arange(1, count)
+    elements[:, :, 3] = t[:, np.newaxis]
+    return (nodes[0], elements[0]) if single else (nodes, elements)
+
+
+def _stack(*points):
+    # Vertices with shape (sections, vertices, 2) from (x, y) pairs of scalars or arrays
+    arrays = np.broadcast_arrays(*(np.asarray(i, dtype=float) for pair in points for i in pair))
+    return np.stack(arrays, axis=-1).reshape(arrays[0].shape + (len(points), 2))
+
+
+def lippedCPoints(A, B, C, t):
+    """
+    Centreline vertices of lipped C sections, the corner points of the SectionProp_C centreline. Rounded with
+    polylineSection they give 42 nodes, SectionProp_C.nodes has 47 with extra nodes inside the flanges and the web.
+    """
+    aa, bb, cc = A - t, B - t, C - t / 2.0
+    return _stack((bb, cc), (bb, 0.0), (0.0, 0.0), (0.0, aa), (bb, aa), (bb, aa - cc))
+
+
+def zPoints(A, B1, B2, C, t):
+    """
+    Centreline vertices of lipped Z sections.
+    :param B1: Bottom flange width.
+    :param B2: Top flange width, on the other side of the web.
+    """
+    aa, b1, b2, cc = A - t, B1 - t / 2.0, B2 - t / 2.0, C - t / 2.0
+    return _stack((b1, cc), (b1, 0.0), (0.0, 0.0), (0.0, aa), (-b2, aa), (-b2, aa - cc))
+
+
+def sigmaPoints(A, B, C, t, e, s, d):
+    """
+    Centreline vertices of sigma sections, lipped C sections with an inward fold of the web.
+    :param e: Straight web part next to the flanges.
+    :param s: Height of the inclined web parts.
+    :param d: Depth of the fold.
+    """
+    aa, bb, cc = A - t, B - t, C - t / 2.0
+    return _stack((bb, cc), (bb, 0.0), (0.0, 0.0), (0.0, e), (d, e + s), (d, aa - e - s), (0.0, aa - e),
+                  (0.0, aa), (bb, aa), (bb, aa - cc))
+
+
+def hatPoints(A, B, C, t):
+    """
+    Centreline vertices of hat sections.
+    :param A: Height.
+    :param B: Width of the top flange.
+    :param C: Width of the bottom flanges.
+    """
+    aa, bb, cc = A - t, B - t, C - t / 2.0
+    return _stack((-cc, 0.0), (0.0, 0.0), (0.0, aa), (bb, aa), (bb, 0.0), (bb + cc, 0.0))